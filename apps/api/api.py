@@ -13,12 +13,19 @@ from dotenv import load_dotenv
 # Import database and orchestrator
 from src.db.database import get_database
 from src.orchestrator import Orchestrator
-from src.orchestrator import Orchestrator
-from src.services.voice_service import VoiceService
+from src.services.voice_service import get_voice_service
 from src.memory.memory_service import get_memory_service
 import asyncio
 import base64
 
+# Use uvloop when available: Tasks/Futures are created in C, trimming
+# event-loop overhead on the await-heavy agent and tool paths
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Load environment variables
 load_dotenv()
 
@@ -54,8 +61,8 @@ async def lifespan(app: FastAPI):
     get_memory_service(db)
     logger.info("Memory Service initialized")
 
-    # Initialize Voice Service
-    voice_service = VoiceService()
+    # Initialize Voice Service (Singleton)
+    voice_service = get_voice_service()
     logger.info("Voice Service initialized")
     
     yield
@@ -66,12 +73,23 @@ async def lifespan(app: FastAPI):
         await db.close()
 
 
+# Serialize responses with orjson when available — tool traces and agent
+# metadata are dict/list-heavy payloads where the C serializer is ~2x
+# faster. fastapi.responses always exports ORJSONResponse (it only fails
+# at render time), so the guard has to probe orjson itself.
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as _DefaultResponse
+
 # Create FastAPI application
 app = FastAPI(
     title="Personal Vibe CEO System",
     description="Multi-agent AI system with Google ADK",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=_DefaultResponse
 )
 
 # Configure CORS
@@ -519,16 +537,12 @@ async def websocket_endpoint(websocket: WebSocket):
 
                 logger.info("Starting VoiceService stream processing...")
                 # Process the stream with Native Audio
-                async for result in voice_service.process_audio_stream(audio_gen):
-                    audio_bytes = result.get("audio")
-                    
+                async for audio_bytes in voice_service.process_audio_stream(audio_gen):
                     if audio_bytes:
-                        # Send audio response directly
-                        audio_b64 = base64.b64encode(audio_bytes).decode('utf-8')
-                        await websocket.send_json({
-                            "type": "audio_response",
-                            "payload": audio_b64
-                        })
+                        # Send raw LINEAR16 PCM as a binary frame. Skipping the
+                        # base64+JSON envelope cuts ~33% off bytes-on-wire and
+                        # avoids an encode/decode per chunk on both ends.
+                        await websocket.send_bytes(audio_bytes)
                 
                 # If the generator finishes normally (e.g. session ended by model), we loop back to reconnect
                 logger.info("Audio stream finished normally, reconnecting for next turn...")
@@ -4,6 +4,9 @@ Consolidates common patterns used across all agents
 """
 
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass
 from typing import AsyncIterator, Tuple, List, Dict, Optional
 from datetime import datetime
 from google.adk import Runner
@@ -190,6 +193,26 @@ async def create_adk_runner(
         raise
 
 
+@dataclass(slots=True)
+class ToolExecution:
+    """Single recorded tool execution; slots keep per-record overhead low"""
+    tool: str
+    input: dict
+    output: dict
+    duration_ms: int
+    ts: float
+
+    def to_dict(self) -> Dict:
+        """Convert to the wire format used in traces/responses"""
+        return {
+            "tool": self.tool,
+            "input": self.input,
+            "output": self.output,
+            "duration_ms": self.duration_ms,
+            "timestamp": datetime.utcfromtimestamp(self.ts).isoformat()
+        }
+
+
 class AgentTracer:
     """
     Tracks full agent execution lifecycle including:
@@ -197,26 +220,42 @@ class AgentTracer:
     - Tool executions (inputs, outputs, duration)
     - Agent steps/reasoning
     """
-    
+
     def __init__(self):
         self._trace = {
             "start_time": datetime.utcnow().isoformat(),
             "steps": [],
-            "tools": [],
             "metadata": {}
         }
         self._start_ts = datetime.now()
-        
+        # ToolExecution records; converted to dicts only when read
+        self._tools: List[ToolExecution] = []
+        # Executions queued by add_tool_execution_nowait; materialized into
+        # ToolExecution records lazily so the hot tool path only pays a
+        # deque append
+        self._pending = deque()
+
     def add_tool_execution(self, tool_name: str, input_data: dict, output_data: dict, duration_ms: int = 0):
         """Record a tool execution"""
-        self._trace["tools"].append({
-            "tool": tool_name,
-            "input": input_data,
-            "output": output_data,
-            "duration_ms": duration_ms,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-        
+        self._tools.append(ToolExecution(tool_name, input_data, output_data, duration_ms, time.time()))
+
+    def add_tool_execution_nowait(self, tool_name: str, input_data: dict, output_data, duration_ms: int = 0):
+        """
+        Queue a tool execution without building the trace entry yet.
+        Use this on hot tool paths; entries are flushed on the next read.
+        output_data may be a zero-arg callable, evaluated lazily at flush
+        time so summary payloads aren't built on the tool path at all.
+        """
+        self._pending.append((tool_name, input_data, output_data, duration_ms, time.time()))
+
+    def _flush_pending(self):
+        """Materialize queued executions into ToolExecution records"""
+        while self._pending:
+            tool_name, input_data, output_data, duration_ms, ts = self._pending.popleft()
+            if callable(output_data):
+                output_data = output_data()
+            self._tools.append(ToolExecution(tool_name, input_data, output_data, duration_ms, ts))
+
     def add_step(self, step_type: str, content: str, metadata: Optional[Dict] = None):
         """Record an agent step (thought, response, etc)"""
         self._trace["steps"].append({
@@ -228,19 +267,21 @@ class AgentTracer:
         
     def end_trace(self):
         """Finalize the trace"""
+        self._flush_pending()
         self._trace["end_time"] = datetime.utcnow().isoformat()
         self._trace["total_duration_ms"] = int((datetime.now() - self._start_ts).total_seconds() * 1000)
-        
+
     def get_trace(self) -> Dict:
         """Get the complete trace"""
-        return self._trace
-        
+        return {**self._trace, "tools": self.get_executions()}
+
     def get_executions(self) -> List[Dict]:
         """
         Get list of tool executions
         Added for backward compatibility with ToolExecutionTracker
         """
-        return self._trace["tools"]
+        self._flush_pending()
+        return [t.to_dict() for t in self._tools]
         
     def clear(self):
         self.__init__()
@@ -3,6 +3,7 @@ Base Agent Class - Common functionality for all ADK agents
 Provides shared methods and patterns to reduce code duplication
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -13,6 +14,10 @@ from ..memory.memory_service import get_memory_service
 
 logger = logging.getLogger(__name__)
 
+# Strong references to in-flight background persistence tasks so the
+# event loop doesn't garbage-collect them mid-write
+_background_tasks = set()
+
 
 class BaseAgent(ABC):
     """
@@ -51,15 +56,19 @@ class BaseAgent(ABC):
 
     async def _store_interaction(self, user_id: str, message: str, response: str):
         """
-        Store the interaction in memory
+        Store the interaction in memory.
+        The write is not on the response critical path, so it runs as a
+        background task and this returns immediately.
         """
         if self.memory_service:
-            await self.memory_service.summarize_interaction(
+            task = asyncio.create_task(self.memory_service.summarize_interaction(
                 user_id=user_id,
                 agent_id=self.agent_id,
                 user_message=message,
                 agent_response=response
-            )
+            ))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
 
     async def _generate_adk_response(
         self,
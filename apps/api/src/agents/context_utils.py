@@ -3,6 +3,7 @@ Shared context utilities for building enhanced prompts with memory, health data,
 """
 
 import logging
+import time
 from typing import Dict, List, Optional
 from datetime import datetime
 try:
@@ -12,6 +13,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# The timezone preference is read for every prompt build on every agent
+# turn but changes essentially never; a short TTL cache drops that DB
+# await from the per-turn path
+_TZ_CACHE_TTL = 60  # seconds
+_tz_cache: Dict[str, tuple] = {}  # user_id -> (ts, tz_str)
+
 async def get_context_string(
     user_id: str,
     db,
@@ -29,8 +36,13 @@ async def get_context_string(
     # 1. Add Time Context
     if include_time:
         try:
-            pref = await db.get_user_preference(user_id, "general", "timezone")
-            tz_str = pref["pref_value"] if pref else "UTC"
+            cached = _tz_cache.get(user_id)
+            if cached and (time.monotonic() - cached[0]) < _TZ_CACHE_TTL:
+                tz_str = cached[1]
+            else:
+                pref = await db.get_user_preference(user_id, "general", "timezone")
+                tz_str = pref["pref_value"] if pref else "UTC"
+                _tz_cache[user_id] = (time.monotonic(), tz_str)
             user_tz = ZoneInfo(tz_str)
             now_local = datetime.now(user_tz)
             parts.append(f"Current User Time: {now_local.strftime('%Y-%m-%d %H:%M')} ({tz_str})")
@@ -3,6 +3,7 @@ Knowledge Agent (A3) - Learning Digest Curator
 ADK-powered agent for personalized learning content curation
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -72,9 +73,12 @@ class KnowledgeAgent(BaseAgent):
         start_time = datetime.now()
         
         try:
-            # Retrieve relevant memories and profile (Proactive Search)
-            memories = await self._get_memories(user_id, query=message)
-            user_profile = await self._get_user_profile(user_id)
+            # Retrieve relevant memories and profile (Proactive Search).
+            # The two lookups are independent I/O; overlap them.
+            memories, user_profile = await asyncio.gather(
+                self._get_memories(user_id, query=message),
+                self._get_user_profile(user_id)
+            )
             
             # Build context-enhanced prompt
             # Format user profile as personal context
@@ -4,13 +4,56 @@ Database models and initialization for the Personal Vibe CEO System
 
 import sqlite3
 import aiosqlite
+import functools
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional
 import os
+import json
+
+# JSON columns (learning interests, medications, embeddings, metadata)
+# round-trip on most profile and memory operations; orjson is several
+# times faster than stdlib json. Optional at runtime, stdlib fallback.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Hot fixed-shape queries as module constants: identical SQL text lets
+# sqlite3's per-connection statement cache reuse the prepared plan
+_SQL_FACTS_BY_USER = "SELECT * FROM user_facts WHERE user_id = ?"
+_SQL_FACTS_BY_USER_CAT = "SELECT * FROM user_facts WHERE user_id = ? AND category = ?"
+_SQL_PREFS_BY_USER = "SELECT * FROM user_preferences WHERE user_id = ?"
+_SQL_PREFS_BY_USER_CAT = "SELECT * FROM user_preferences WHERE user_id = ? AND category = ?"
+_SQL_EVENTS_BETWEEN = (
+    "SELECT * FROM calendar_events "
+    "WHERE user_id = ? AND status != 'cancelled' "
+    "AND start_time >= ? AND start_time <= ? "
+    "ORDER BY start_time ASC"
+)
+_SQL_EVENTS_OVERLAPPING = (
+    "SELECT * FROM calendar_events "
+    "WHERE user_id = ? AND status != 'cancelled' "
+    "AND start_time < ? AND end_time > ? "
+    "ORDER BY start_time ASC"
+)
+
+@functools.lru_cache(maxsize=32)
+def _facts_in_sql(n: int) -> str:
+    """IN-clause fact query for n categories, memoized per arity"""
+    placeholders = ", ".join("?" * n)
+    return f"SELECT * FROM user_facts WHERE user_id = ? AND category IN ({placeholders})"
+
 
 class Database:
     """Database manager for SQLite"""
@@ -43,7 +86,9 @@ class Database:
             os.makedirs(db_dir, exist_ok=True)
             logger.info(f"Created database directory: {db_dir}")
         
-        self.connection = await aiosqlite.connect(self.db_path)
+        # A larger statement cache keeps the hot fixed-shape queries
+        # prepared across calls instead of re-parsing their SQL
+        self.connection = await aiosqlite.connect(self.db_path, cached_statements=256)
         self.connection.row_factory = aiosqlite.Row
         
         # Enable WAL mode for better concurrency
@@ -257,10 +302,9 @@ class Database:
         learning_interests: List[str] = None
     ) -> Dict:
         """Create a new user"""
-        import json
         
         now = datetime.utcnow().isoformat()
-        interests_json = json.dumps(learning_interests or [])
+        interests_json = _dumps(learning_interests or [])
         
         await self.connection.execute(
             """
@@ -275,7 +319,6 @@ class Database:
     
     async def get_user(self, user_id: str) -> Optional[Dict]:
         """Get user by ID"""
-        import json
         
         async with self.connection.execute(
             "SELECT * FROM users WHERE user_id = ?",
@@ -288,7 +331,7 @@ class Database:
                     "name": row["name"],
                     "email": row["email"] if "email" in row.keys() else None,
                     "google_id": row["google_id"] if "google_id" in row.keys() else None,
-                    "learning_interests": json.loads(row["learning_interests"]),
+                    "learning_interests": _loads(row["learning_interests"]),
                     "created_at": row["created_at"],
                     "updated_at": row["updated_at"]
                 }
@@ -296,7 +339,6 @@ class Database:
 
     async def get_user_by_google_id(self, google_id: str) -> Optional[Dict]:
         """Get user by Google ID"""
-        import json
         
         async with self.connection.execute(
             "SELECT * FROM users WHERE google_id = ?",
@@ -309,7 +351,7 @@ class Database:
                     "name": row["name"],
                     "email": row["email"],
                     "google_id": row["google_id"],
-                    "learning_interests": json.loads(row["learning_interests"]),
+                    "learning_interests": _loads(row["learning_interests"]),
                     "created_at": row["created_at"],
                     "updated_at": row["updated_at"]
                 }
@@ -322,7 +364,6 @@ class Database:
         learning_interests: List[str] = None
     ) -> Dict:
         """Update user information"""
-        import json
         
         updates = []
         params = []
@@ -333,7 +374,7 @@ class Database:
         
         if learning_interests is not None:
             updates.append("learning_interests = ?")
-            params.append(json.dumps(learning_interests))
+            params.append(_dumps(learning_interests))
         
         updates.append("updated_at = ?")
         params.append(datetime.utcnow().isoformat())
@@ -420,11 +461,10 @@ class Database:
         metadata: Dict = None
     ) -> Dict:
         """Create a memory context entry"""
-        import json
         
         timestamp = datetime.utcnow().isoformat()
-        embedding_json = json.dumps(embedding_vector) if embedding_vector else None
-        metadata_json = json.dumps(metadata) if metadata else None
+        embedding_json = _dumps(embedding_vector) if embedding_vector else None
+        metadata_json = _dumps(metadata) if metadata else None
         
         await self.connection.execute(
             """
@@ -442,7 +482,6 @@ class Database:
     
     async def get_memory_context(self, context_id: str) -> Optional[Dict]:
         """Get memory context by ID"""
-        import json
         
         async with self.connection.execute(
             "SELECT * FROM memory_contexts WHERE context_id = ?",
@@ -456,9 +495,9 @@ class Database:
                     "agent_id": row["agent_id"],
                     "data_source_id": row["data_source_id"],
                     "summary_text": row["summary_text"],
-                    "embedding_vector": json.loads(row["embedding_vector"]) if row["embedding_vector"] else None,
+                    "embedding_vector": _loads(row["embedding_vector"]) if row["embedding_vector"] else None,
                     "timestamp": row["timestamp"],
-                    "metadata": json.loads(row["metadata"]) if row["metadata"] else None
+                    "metadata": _loads(row["metadata"]) if row["metadata"] else None
                 }
         return None
     
@@ -469,7 +508,6 @@ class Database:
         limit: int = 5
     ) -> List[Dict]:
         """Get recent memory contexts for a specific agent and user"""
-        import json
         
         async with self.connection.execute(
             """
@@ -488,9 +526,9 @@ class Database:
                     "agent_id": row["agent_id"],
                     "data_source_id": row["data_source_id"],
                     "summary_text": row["summary_text"],
-                    "embedding_vector": json.loads(row["embedding_vector"]) if row["embedding_vector"] else None,
+                    "embedding_vector": _loads(row["embedding_vector"]) if row["embedding_vector"] else None,
                     "timestamp": row["timestamp"],
-                    "metadata": json.loads(row["metadata"]) if row["metadata"] else None
+                    "metadata": _loads(row["metadata"]) if row["metadata"] else None
                 }
                 for row in rows
             ]
@@ -597,6 +635,38 @@ class Database:
         
         return await self.get_user_fact(user_id, category, fact_key)
 
+    async def save_user_facts_batch(self, rows: List[Dict]) -> List[Dict]:
+        """Save several user facts in one executemany + single commit"""
+        now = datetime.utcnow().isoformat()
+
+        params = []
+        for r in rows:
+            async with self.connection.execute(
+                "SELECT created_at FROM user_facts WHERE user_id = ? AND category = ? AND fact_key = ?",
+                (r["user_id"], r["category"], r["fact_key"])
+            ) as cursor:
+                row = await cursor.fetchone()
+                created_at = row["created_at"] if row else now
+            params.append((
+                r["fact_id"], r["user_id"], r["category"],
+                r["fact_key"], r["fact_value"], created_at, now
+            ))
+
+        await self.connection.executemany(
+            """
+            INSERT OR REPLACE INTO user_facts
+            (fact_id, user_id, category, fact_key, fact_value, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            params
+        )
+        await self.connection.commit()
+
+        return [
+            await self.get_user_fact(r["user_id"], r["category"], r["fact_key"])
+            for r in rows
+        ]
+
     async def get_user_fact(self, user_id: str, category: str, fact_key: str) -> Optional[Dict]:
         """Get a specific user fact"""
         async with self.connection.execute(
@@ -608,17 +678,27 @@ class Database:
 
     async def get_user_facts(self, user_id: str, category: str = None) -> List[Dict]:
         """Get all facts for a user, optionally filtered by category"""
-        query = "SELECT * FROM user_facts WHERE user_id = ?"
-        params = [user_id]
-        
+        # Constant SQL text so sqlite3's per-connection statement cache
+        # serves the prepared plan instead of re-parsing each call
         if category:
-            query += " AND category = ?"
-            params.append(category)
-            
+            query = _SQL_FACTS_BY_USER_CAT
+            params = (user_id, category)
+        else:
+            query = _SQL_FACTS_BY_USER
+            params = (user_id,)
+
         async with self.connection.execute(query, params) as cursor:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
+    async def get_user_facts_multi(self, user_id: str, categories: List[str]) -> List[Dict]:
+        """Get facts for a user across several categories in one query"""
+        query = _facts_in_sql(len(categories))
+
+        async with self.connection.execute(query, [user_id, *categories]) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
     # ========================================================================
     # Medical Profile operations
     # ========================================================================
@@ -633,9 +713,8 @@ class Database:
         medications: List[str] = None
     ) -> Dict:
         """Save or update a medical condition"""
-        import json
         now = datetime.utcnow().isoformat()
-        meds_json = json.dumps(medications or [])
+        meds_json = _dumps(medications or [])
         
         async with self.connection.execute(
             "SELECT created_at FROM medical_profile WHERE condition_id = ?",
@@ -658,7 +737,6 @@ class Database:
 
     async def get_medical_condition(self, condition_id: str) -> Optional[Dict]:
         """Get a specific medical condition"""
-        import json
         async with self.connection.execute(
             "SELECT * FROM medical_profile WHERE condition_id = ?",
             (condition_id,)
@@ -666,13 +744,12 @@ class Database:
             row = await cursor.fetchone()
             if row:
                 res = dict(row)
-                res["medications"] = json.loads(res["medications"])
+                res["medications"] = _loads(res["medications"])
                 return res
             return None
 
     async def get_user_medical_profile(self, user_id: str) -> List[Dict]:
         """Get all medical conditions for a user"""
-        import json
         async with self.connection.execute(
             "SELECT * FROM medical_profile WHERE user_id = ?",
             (user_id,)
@@ -681,7 +758,7 @@ class Database:
             results = []
             for row in rows:
                 res = dict(row)
-                res["medications"] = json.loads(res["medications"])
+                res["medications"] = _loads(res["medications"])
                 results.append(res)
             return results
 
@@ -719,6 +796,38 @@ class Database:
         
         return await self.get_user_preference(user_id, category, pref_key)
 
+    async def save_user_preferences_batch(self, rows: List[Dict]) -> List[Dict]:
+        """Save several user preferences in one executemany + single commit"""
+        now = datetime.utcnow().isoformat()
+
+        params = []
+        for r in rows:
+            async with self.connection.execute(
+                "SELECT created_at FROM user_preferences WHERE user_id = ? AND category = ? AND pref_key = ?",
+                (r["user_id"], r["category"], r["pref_key"])
+            ) as cursor:
+                row = await cursor.fetchone()
+                created_at = row["created_at"] if row else now
+            params.append((
+                r["pref_id"], r["user_id"], r["category"],
+                r["pref_key"], r["pref_value"], created_at, now
+            ))
+
+        await self.connection.executemany(
+            """
+            INSERT OR REPLACE INTO user_preferences
+            (pref_id, user_id, category, pref_key, pref_value, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            params
+        )
+        await self.connection.commit()
+
+        return [
+            await self.get_user_preference(r["user_id"], r["category"], r["pref_key"])
+            for r in rows
+        ]
+
     async def get_user_preference(self, user_id: str, category: str, pref_key: str) -> Optional[Dict]:
         """Get a specific user preference"""
         async with self.connection.execute(
@@ -730,13 +839,13 @@ class Database:
 
     async def get_user_preferences(self, user_id: str, category: str = None) -> List[Dict]:
         """Get all preferences for a user"""
-        query = "SELECT * FROM user_preferences WHERE user_id = ?"
-        params = [user_id]
-        
         if category:
-            query += " AND category = ?"
-            params.append(category)
-            
+            query = _SQL_PREFS_BY_USER_CAT
+            params = (user_id, category)
+        else:
+            query = _SQL_PREFS_BY_USER
+            params = (user_id,)
+
         async with self.connection.execute(query, params) as cursor:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
@@ -841,6 +950,35 @@ class Database:
         
         return await self.get_event(event_id)
 
+    async def create_events_bulk(self, rows: List[Dict]) -> int:
+        """Insert many calendar events in one executemany + single commit.
+
+        Each row needs event_id, user_id, title, start_time and end_time;
+        description, location and google_event_id are optional.
+        """
+        if not rows:
+            return 0
+        now = datetime.utcnow().isoformat()
+
+        await self.connection.executemany(
+            """
+            INSERT INTO calendar_events
+            (event_id, user_id, title, description, start_time, end_time, location, status, google_event_id, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 'scheduled', ?, ?, ?)
+            """,
+            [
+                (
+                    row["event_id"], row["user_id"], row["title"],
+                    row.get("description"), row["start_time"], row["end_time"],
+                    row.get("location"), row.get("google_event_id"), now, now
+                )
+                for row in rows
+            ]
+        )
+        await self.connection.commit()
+
+        return len(rows)
+
     async def update_event(
         self,
         event_id: str,
@@ -923,6 +1061,44 @@ class Database:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
+    async def get_user_events_between(
+        self,
+        user_id: str,
+        start_time: str,
+        end_time: str
+    ) -> List[Dict]:
+        """Get active events starting within [start_time, end_time].
+
+        Both bounds are ISO strings in UTC and go into the WHERE clause,
+        so the (user_id, start_time) index returns exactly the window
+        instead of every future event.
+        """
+        async with self.connection.execute(
+            _SQL_EVENTS_BETWEEN,
+            (user_id, start_time, end_time)
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    async def get_events_overlapping(
+        self,
+        user_id: str,
+        start_time: str,
+        end_time: str
+    ) -> List[Dict]:
+        """Get active events overlapping the [start_time, end_time) window.
+
+        Times are ISO strings in UTC; the interval test runs in SQL so the
+        (user_id, start_time) index prunes candidates instead of loading
+        every stored event.
+        """
+        async with self.connection.execute(
+            _SQL_EVENTS_OVERLAPPING,
+            (user_id, end_time, start_time)
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
     # ========================================================================
     # User Integration operations
     # ========================================================================
@@ -957,7 +1133,7 @@ class Database:
                 (credentials_json, now, integration_id)
             )
         else:
-            integration_id = str(uuid.uuid4())
+            integration_id = uuid.uuid4().hex
             created_at = now
             
             await self.connection.execute(
@@ -0,0 +1,19 @@
+"""
+Shared GenAI client for the Personal Vibe CEO System
+One process-wide client so every consumer (voice sessions, embeddings)
+reuses the same auth and HTTP transport instead of re-handshaking.
+"""
+
+from google import genai
+
+_client = None
+
+
+def get_genai_client():
+    """Get or create the process-wide GenAI client"""
+    global _client
+    if _client is None:
+        _client = genai.Client(
+            http_options={'api_version': 'v1alpha'}
+        )
+    return _client
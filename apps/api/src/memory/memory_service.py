@@ -20,14 +20,17 @@ class SessionMemory:
     """
     def __init__(self, max_turns: int = 20):
         self.max_turns = max_turns
-        self.history: Dict[str, List[Dict]] = {} 
+        self.history: Dict[str, List[Dict]] = {}
         self.summaries: Dict[str, str] = {}
+        # Bumped on every mutation; lets formatters cache per revision
+        self.revisions: Dict[str, int] = {}
 
     def add_message(self, user_id: str, role: str, content: str):
         if user_id not in self.history:
             self.history[user_id] = []
             self.summaries[user_id] = ""
-        
+
+        self.revisions[user_id] = self.revisions.get(user_id, 0) + 1
         self.history[user_id].append({
             "role": role,
             "content": content,
@@ -73,6 +76,8 @@ class ADKMemoryService:
         self.db = db
         self.vector_store = VectorStore()
         self.session_memory = SessionMemory()
+        # user_id -> (session revision, formatted short-term context)
+        self._short_term_cache: Dict[str, tuple] = {}
         logger.info("ADK Memory Service initialized with Vector Store")
     
     async def get_agent_memories(
@@ -132,6 +137,10 @@ class ADKMemoryService:
             )
             
             logger.info(f"Stored memory for {agent_id} agent, user {user_id}")
+            # The memory tools TTL-cache search results; a new memory
+            # makes the user's cached hits stale
+            from ..tools.memory_tools import invalidate_search_cache
+            invalidate_search_cache(user_id)
             return {"id": context_id, "summary": summary_text}
         except Exception as e:
             logger.error(f"Failed to store memory: {e}")
@@ -143,18 +152,27 @@ class ADKMemoryService:
 
     def get_short_term_context(self, user_id: str) -> str:
         """Get formatted short-term history with summary"""
+        # Reuse the formatted block while the session log is unchanged;
+        # several prompt builds can happen between turns
+        revision = self.session_memory.revisions.get(user_id, 0)
+        cached = self._short_term_cache.get(user_id)
+        if cached and cached[0] == revision:
+            return cached[1]
+
         history = self.session_memory.get_history(user_id)
         summary = self.session_memory.get_summary(user_id)
-        
-        formatted = ""
+
+        # Assemble in one join instead of growing a string per message
+        parts = []
         if summary:
-            formatted += f"Session Summary:\n{summary}\n\n"
-            
+            parts.append(f"Session Summary:\n{summary}\n\n")
+
         if history:
-            formatted += "Current Conversation:\n"
-            for msg in history:
-                formatted += f"{msg['role']}: {msg['content']}\n"
-            
+            parts.append("Current Conversation:\n")
+            parts.extend(f"{msg['role']}: {msg['content']}\n" for msg in history)
+
+        formatted = "".join(parts)
+        self._short_term_cache[user_id] = (revision, formatted)
         return formatted
 
     async def summarize_interaction(
@@ -3,6 +3,7 @@ Vector Store Implementation
 Provides semantic search capabilities using Google GenAI embeddings and SQLite.
 """
 
+import asyncio
 import logging
 import json
 import sqlite3
@@ -10,6 +11,21 @@ import numpy as np
 from typing import List, Dict, Optional, Tuple
 from google import genai
 
+from ..genai_client import get_genai_client
+
+# Embeddings are lists of hundreds of floats per row; orjson encodes and
+# decodes them several times faster than stdlib json. Optional at runtime.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 class VectorStore:
@@ -23,9 +39,9 @@ class VectorStore:
         self.model_id = "text-embedding-004"
         
         try:
-            self.client = genai.Client(
-                http_options={'api_version': 'v1alpha'}
-            )
+            # Shared process-wide client; avoids a second connection pool
+            # and TLS setup alongside the voice service's
+            self.client = get_genai_client()
             self._init_db()
         except Exception as e:
             logger.error(f"Failed to initialize VectorStore: {e}")
@@ -51,13 +67,18 @@ class VectorStore:
 
     async def embed_text(self, text: str) -> List[float]:
         """Generate embedding for text using Gemini"""
-        if not self.client:
+        if not self.client or not text or not text.strip():
             return []
-            
+
         try:
-            result = self.client.models.embed_content(
-                model=self.model_id,
-                contents=text
+            # Use the SDK's native async surface (no worker thread needed)
+            # and bound the call so a hung request can't stall a turn
+            result = await asyncio.wait_for(
+                self.client.aio.models.embed_content(
+                    model=self.model_id,
+                    contents=text
+                ),
+                timeout=30
             )
             return result.embeddings[0].values
         except Exception as e:
@@ -84,8 +105,8 @@ class VectorStore:
                     (
                         doc_id,
                         content,
-                        json.dumps(embedding),
-                        json.dumps(metadata),
+                        _dumps(embedding),
+                        _dumps(metadata),
                         agent_id,
                         user_id
                     )
@@ -126,7 +147,7 @@ class VectorStore:
                 
                 for row in rows:
                     doc_id, content, emb_json, meta_json, created_at = row
-                    doc_vec = np.array(json.loads(emb_json))
+                    doc_vec = np.array(_loads(emb_json))
                     
                     # Cosine Similarity
                     similarity = np.dot(query_vec, doc_vec) / (np.linalg.norm(query_vec) * np.linalg.norm(doc_vec))
@@ -134,7 +155,7 @@ class VectorStore:
                     results.append({
                         "id": doc_id,
                         "content": content,
-                        "metadata": json.loads(meta_json),
+                        "metadata": _loads(meta_json),
                         "score": float(similarity),
                         "created_at": created_at
                     })
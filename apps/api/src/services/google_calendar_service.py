@@ -1,11 +1,34 @@
 import logging
-import json
+from datetime import datetime, timedelta
+
+try:
+    import orjson as _json  # C-level parser, ~2x faster for small blobs
+except ImportError:
+    import json as _json
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from src.db.database import get_database
 
 logger = logging.getLogger(__name__)
 
+# Parsed Credentials per user_id, so repeat tool calls in the same process
+# skip the DB fetch + JSON parse + credential construction
+_CREDS_CACHE: dict = {}
+
+
+def _cached_credentials(user_id: str):
+    """Return cached Credentials for the user if still valid, else None"""
+    creds = _CREDS_CACHE.get(user_id)
+    if creds is None:
+        return None
+    # Keep a 60s safety margin before expiry; tokens without expiry are
+    # trusted as long as the library reports them valid
+    if creds.valid and (creds.expiry is None or creds.expiry > datetime.utcnow() + timedelta(seconds=60)):
+        return creds
+    _CREDS_CACHE.pop(user_id, None)
+    return None
+
+
 class GoogleCalendarService:
     def __init__(self, user_id: str):
         self.user_id = user_id
@@ -13,25 +36,34 @@ class GoogleCalendarService:
 
     async def authenticate(self):
         """Authenticate using stored credentials"""
-        db = await get_database()
-        integration = await db.get_integration(self.user_id, "google_calendar")
-        
-        if not integration:
-            logger.warning(f"No Google Calendar integration found for user {self.user_id}")
-            return False
+        credentials = _cached_credentials(self.user_id)
+
+        if credentials is None:
+            db = await get_database()
+            integration = await db.get_integration(self.user_id, "google_calendar")
+
+            if not integration:
+                logger.warning(f"No Google Calendar integration found for user {self.user_id}")
+                return False
+
+            try:
+                creds_data = _json.loads(integration["credentials_json"])
+                credentials = Credentials.from_authorized_user_info(creds_data)
+                _CREDS_CACHE[self.user_id] = credentials
+            except Exception as e:
+                logger.error(f"Failed to load Google Calendar credentials: {e}")
+                return False
 
         try:
-            creds_data = json.loads(integration["credentials_json"])
-            credentials = Credentials.from_authorized_user_info(creds_data)
-            
-            # Re-save if refreshed (not fully implemented here without a refresh flow loop, 
+            # Re-save if refreshed (not fully implemented here without a refresh flow loop,
             # but google library handles refresh if we provide client config)
             # For now, we assume credentials are valid or auto-refreshed by the library if we had the request object
-            
+
             self.service = build('calendar', 'v3', credentials=credentials)
             return True
         except Exception as e:
             logger.error(f"Failed to authenticate Google Calendar: {e}")
+            _CREDS_CACHE.pop(self.user_id, None)
             return False
 
     async def create_event(self, event_data: dict):
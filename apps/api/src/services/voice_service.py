@@ -1,6 +1,10 @@
 import os
 import logging
 import asyncio
+import hashlib
+import time
+import numpy as np
+from collections import deque
 from typing import AsyncGenerator, Dict, Any, List
 from google import genai
 from google.genai import types
@@ -11,9 +15,57 @@ from src.services.stt_service import AsyncSTTService
 from src.agents.context_utils import get_context_string
 from src.db.database import get_database
 from src.agents.orchestrator_core import get_orchestrator_tools, get_orchestrator_instruction
+from src.tools.adk_tools import TOOLS_BY_NAME
+from src.genai_client import get_genai_client
 
 logger = logging.getLogger(__name__)
 
+# RMS threshold below which a 16-bit PCM frame is treated as silence
+SILENCE_RMS_THRESHOLD = 200
+
+# Coalesce upstream audio into ~40ms frames before sending to Gemini/STT
+# (16kHz mono PCM16: 16000 * 1 * 2 * 0.040 = 1280 bytes) so tiny browser
+# chunks don't each cost a websocket write + queue op
+FLUSH_THRESHOLD_BYTES = 1280
+
+# Assembled context strings per user: user_id -> (expires_at, short_term_digest, context_string).
+# Context assembly is dominated by DB + vector-store round trips, so reuse the
+# result across reconnects while the short-term history hasn't changed.
+CONTEXT_CACHE_TTL = 300
+_context_cache: Dict[str, tuple] = {}
+
+# Stable context inputs per user: user_id -> (expires_at, long_term, personal_context).
+# Facts/prefs/medical and long-term retrieval barely change between turns,
+# so when only the short-term history moved we rebuild the context string
+# from these instead of re-querying DB + vector store.
+STATIC_CONTEXT_TTL = 60
+_static_context_cache: Dict[str, tuple] = {}
+
+
+def _invalidate_context_cache(user_id: str):
+    """Drop the cached context for a user (e.g. after new memories are stored)"""
+    _context_cache.pop(user_id, None)
+    _static_context_cache.pop(user_id, None)
+
+# Digest of the last stored interaction per user, used to skip long-term
+# persistence of repeated near-identical exchanges ("ok", "yes", ...)
+_last_interaction_digest: Dict[str, str] = {}
+
+# Single GenAI client shared across all VoiceService instances/sessions;
+# each aio.live.connect call gets its own session, but the client (and its
+# auth/transport setup) only needs to exist once per process
+_get_genai_client = get_genai_client
+
+
+def _is_silent(chunk: bytes) -> bool:
+    """Cheap RMS check to detect near-silent 16-bit PCM frames"""
+    samples = np.frombuffer(chunk, dtype=np.int16)
+    if samples.size == 0:
+        return True
+    rms = np.sqrt(np.mean(samples.astype(np.int32) ** 2))
+    return rms < SILENCE_RMS_THRESHOLD
+
+
 class VoiceService:
     """
     Service for handling Voice interactions using Gemini Native Audio (Multimodal Live API).
@@ -23,36 +75,64 @@ class VoiceService:
     def __init__(self):
         """Initialize VoiceService"""
         self.model_id = "gemini-2.5-flash-native-audio-preview-09-2025"
-        self.memory_service = get_memory_service()
-        self.stt_service = AsyncSTTService()
+        self._memory_service = None
         self.stt_service = AsyncSTTService()
         self.client = None
-        self.current_user_transcript = ""
-        self.current_model_response = ""
+        self._db = None
         
         # Define the Vibe CEO Persona
         self.system_instruction = get_orchestrator_instruction("voice")
+        # Pre-joined prefix so the per-connect instruction build is one concat
+        self._system_instruction_prefix = self.system_instruction + "\n\n"
         
         # Define Tools
         self.tools = get_orchestrator_tools()
-        
+        # The live-connect serializer only understands raw callables (it
+        # builds functionDeclarations from them), not ADK FunctionTool
+        # wrappers -- hand it the unwrapped functions
+        self._live_tools = tuple(t.func for t in self.tools)
+        # Name -> callable lookup so tool dispatch doesn't scan the list;
+        # shared frozen map, built once at tool-module import
+        self._tools_by_name = TOOLS_BY_NAME
+
+        # Static voice/audio selection config. This never changes between
+        # sessions, so build it once here instead of per process_audio_stream call.
+        self.speech_config = {
+            "voice_config": {
+                "prebuilt_voice_config": {
+                    "voice_name": "Puck"
+                }
+            }
+        }
+
         # Attempt initial initialization
         self._initialize_client()
 
+    @property
+    def memory_service(self):
+        """Memory service, resolved lazily.
+
+        At construction time the global service may not exist yet (it is
+        created with the database on startup); binding it eagerly froze
+        that None onto the instance for its whole lifetime.
+        """
+        if self._memory_service is None:
+            self._memory_service = get_memory_service()
+        return self._memory_service
+
     def _initialize_client(self):
         """Initialize Google GenAI client"""
         try:
-            self.client = genai.Client(
-                http_options={'api_version': 'v1alpha'}
-            )
+            self.client = _get_genai_client()
             logger.info(f"VoiceService initialized with model: {self.model_id}")
         except Exception as e:
             logger.error(f"Failed to initialize VoiceService client: {e}")
             self.client = None
 
-    async def process_audio_stream(self, audio_generator: AsyncGenerator[bytes, None]) -> AsyncGenerator[Dict, None]:
+    async def process_audio_stream(self, audio_generator: AsyncGenerator[bytes, None]) -> AsyncGenerator[bytes, None]:
         """
         Process bidirectional audio stream with Gemini.
+        Yields raw PCM response chunks ready for the transport layer.
         """
         if not self.client:
             logger.warning("GenAI client not initialized, attempting to re-initialize...")
@@ -66,194 +146,278 @@ class VoiceService:
         # 1. Fetch Memory Context
         from src.context import get_current_user_id
         user_id = get_current_user_id()
-        memory_context = ""
         personal_context = ""
-        
+        short_term = ""
+        long_term = []
+
+        # Short-term history is in-process and cheap; hash it to decide whether
+        # the expensive long-term/personal fetches and context assembly can be
+        # skipped for this reconnect
         if self.memory_service:
-            try:
-                # Get Short-Term (Session) Context
-                short_term = self.memory_service.get_short_term_context(user_id)
-                
-                # Get Long-Term (Vector) Context
-                long_term = await self.memory_service.get_agent_memories(user_id, "vibe", limit=3)
-                
-                # Get Personal Context (Facts, Prefs, Medical, Tasks, Events)
-                personal_context = await self.memory_service.get_user_context(user_id)
-                logger.info(f"Voice Service: Retrieved personal context (length: {len(personal_context)})")
-                
-                if short_term or long_term or personal_context:
-                    memory_context = "\n\nCONTEXT:\n"
-                    
-                    if personal_context:
-                        memory_context += f"{personal_context}\n"
-                    
-                    if long_term:
-                        memory_context += "Relevant Past Details:\n" + "\n".join([f"- {m.get('summary_text', '')}" for m in long_term]) + "\n"
-                    
-                    if short_term:
-                        memory_context += f"\n{short_term}"
-                    
-                    logger.info(f"Voice Service: Full memory context length: {len(memory_context)}")
-            except Exception as e:
-                logger.error(f"Failed to fetch memory context for voice: {e}", exc_info=True)
-
-        # 2. Update System Instruction
-        # Use shared context utility to build the context string
-        db = await get_database()
-        context_string = await get_context_string(
-            user_id=user_id,
-            db=db,
-            memories=long_term,
-            personal_context=personal_context,
-            short_term_context=short_term,
-            include_time=True
-        )
-        
-        dynamic_system_instruction = self.system_instruction + "\n\n" + context_string
-        
-        # Log the instruction to verify
-        logger.info(f"Voice Service: System instruction updated. Length: {len(dynamic_system_instruction)}")
-        logger.info(f"Voice Service: Instruction Tail (Context): {dynamic_system_instruction[-500:]}")
+            short_term = self.memory_service.get_short_term_context(user_id)
+
+        short_term_digest = hashlib.sha256(
+            f"{user_id}|{short_term}".encode()
+        ).hexdigest()
+
+        cached = _context_cache.get(user_id)
+        if cached and cached[0] > time.monotonic() and cached[1] == short_term_digest:
+            context_string = cached[2]
+            logger.info("Voice Service: Reusing cached context string")
+        else:
+            static_cached = _static_context_cache.get(user_id)
+            if static_cached and static_cached[0] > time.monotonic():
+                # Only short-term changed; reuse the stable inputs
+                long_term, personal_context = static_cached[1], static_cached[2]
+            elif self.memory_service:
+                # Long-Term (Vector) Context and Personal Context (Facts,
+                # Prefs, Medical, Tasks, Events) are independent round trips;
+                # overlap them so we pay max() instead of sum() of latencies
+                long_term, personal_context = await asyncio.gather(
+                    self.memory_service.get_agent_memories(user_id, "vibe", limit=3),
+                    self.memory_service.get_user_context(user_id),
+                    return_exceptions=True
+                )
+                if isinstance(long_term, Exception):
+                    logger.error(f"Failed to fetch long-term memories for voice: {long_term}")
+                    long_term = []
+                if isinstance(personal_context, Exception):
+                    logger.error(f"Failed to fetch personal context for voice: {personal_context}")
+                    personal_context = ""
+                else:
+                    logger.info(f"Voice Service: Retrieved personal context (length: {len(personal_context)})")
+                _static_context_cache[user_id] = (
+                    time.monotonic() + STATIC_CONTEXT_TTL,
+                    long_term,
+                    personal_context
+                )
+
+            # 2. Update System Instruction
+            # Use shared context utility to build the context string
+            if self._db is None:
+                self._db = await get_database()
+            context_string = await get_context_string(
+                user_id=user_id,
+                db=self._db,
+                memories=long_term,
+                personal_context=personal_context,
+                short_term_context=short_term,
+                include_time=True
+            )
+            _context_cache[user_id] = (
+                time.monotonic() + CONTEXT_CACHE_TTL,
+                short_term_digest,
+                context_string
+            )
+
+        dynamic_system_instruction = self._system_instruction_prefix + context_string
+
+        # Log the instruction to verify (debug only -- the tail slice
+        # materializes a copy on every connect)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Voice Service: System instruction updated. Length: {len(dynamic_system_instruction)}")
+            logger.debug(f"Voice Service: Instruction Tail (Context): {dynamic_system_instruction[-500:]}")
 
         config = {
             "response_modalities": ["AUDIO"],
-            "tools": self.tools,
+            "tools": self._live_tools,
             "system_instruction": dynamic_system_instruction,
-            "speech_config": {
-                "voice_config": {
-                    "prebuilt_voice_config": {
-                        "voice_name": "Puck"
-                    }
-                }
-            }
+            "speech_config": self.speech_config
         }
 
         try:
             async with self.client.aio.live.connect(model=self.model_id, config=config) as session:
                 logger.info("Connected to Gemini Live session with Tools")
 
-                # STT Queue
-                stt_queue = asyncio.Queue()
+                # Per-turn transcript state is local to this stream: the
+                # service instance is shared (singleton), so instance
+                # attributes would let concurrent sessions clobber each other
+                current_user_transcript = ""
+                model_response_parts = []
+
+                # STT buffer. Single producer (send_audio) and single consumer
+                # (stt_generator) on one loop, so a deque plus a wake-up Event
+                # is lighter than asyncio.Queue (no Future per put/get). The
+                # maxlen bound drops the oldest frame on overflow; STT is
+                # best-effort (Gemini is authoritative).
+                stt_buf = deque(maxlen=16)
+                stt_ready = asyncio.Event()
+
+                def stt_enqueue(item):
+                    stt_buf.append(item)
+                    stt_ready.set()
 
                 # Generator for STT
                 async def stt_generator():
                     while True:
-                        chunk = await stt_queue.get()
+                        while not stt_buf:
+                            stt_ready.clear()
+                            await stt_ready.wait()
+                        chunk = stt_buf.popleft()
                         if chunk is None:
                             break
                         yield chunk
 
                 # Task to run STT
                 async def run_stt():
+                    nonlocal current_user_transcript
                     if self.stt_service:
                         async for transcript in self.stt_service.transcribe(stt_generator()):
                             if transcript:
-                                logger.info(f"User said: {transcript}")
-                                # Store User Input in Memory
-                                self.current_user_transcript = transcript
-                                if self.memory_service:
-                                    self.memory_service.add_to_short_term(user_id, "user", transcript)
-
-                stt_task = asyncio.create_task(run_stt())
+                                logger.debug("User said: %s", transcript)
+                                # Keep the latest transcript; short-term memory
+                                # is written once per turn, not per STT emit
+                                current_user_transcript = transcript
 
                 # Task to send audio to the model AND STT
                 async def send_audio():
                     try:
+                        # Last silent frame, re-sent as a prefix when speech
+                        # resumes so VAD timing isn't confused by the gap
+                        pending_silence = None
+                        buf = bytearray()
+
+                        async def flush():
+                            data = bytes(buf)
+                            buf.clear()
+                            # Send to Gemini
+                            await session.send(input={"data": data, "mime_type": "audio/pcm"}, end_of_turn=False)
+                            # Fan out the same immutable bytes object to STT --
+                            # no copy, both consumers share the backing buffer
+                            stt_enqueue(data)
+
                         async for chunk in audio_generator:
                             if chunk:
-                                # Send to Gemini
-                                await session.send(input={"data": chunk, "mime_type": "audio/pcm"}, end_of_turn=False)
-                                # Send to STT
-                                stt_queue.put_nowait(chunk)
-                                
+                                # Drop near-silent frames (session start, gaps
+                                # between utterances) instead of forwarding them
+                                if _is_silent(chunk):
+                                    pending_silence = chunk
+                                    continue
+                                if pending_silence:
+                                    buf.extend(pending_silence)
+                                    pending_silence = None
+                                buf.extend(chunk)
+                                if len(buf) >= FLUSH_THRESHOLD_BYTES:
+                                    await flush()
+
+                        if buf:
+                            await flush()
                         logger.info("Audio generator finished, stopping send_audio")
-                        stt_queue.put_nowait(None) # Signal STT to stop
+                        stt_enqueue(None) # Signal STT to stop
                     except Exception as e:
                         logger.error(f"Error in send_audio task: {e}")
 
-                # Start sending task
-                send_task = asyncio.create_task(send_audio())
-
-                try:
-                    # Receive loop
-                    async for response in session.receive():
-                        # Handle Text Response (for Memory) - IF enabled in future
-                        if response.server_content and response.server_content.model_turn:
-                            for part in response.server_content.model_turn.parts:
-                                if part.text:
-                                    text_content = part.text
-                                    self.current_model_response += text_content
-                                    if self.memory_service:
-                                        self.memory_service.add_to_short_term(user_id, "model", text_content)
-
-                        # Handle Audio Response
-                        if response.data:
-                            logger.info("VoiceService: Received audio chunk")
-                            yield {
-                                "audio": response.data,
-                                "text": None
-                            }
+                # TaskGroup owns the helper tasks: if either raises, the
+                # sibling (and this scope) is cancelled automatically, and
+                # exiting the group awaits both without the manual
+                # cancel/await bookkeeping getting out of sync.
+                async with asyncio.TaskGroup() as tg:
+                    stt_task = tg.create_task(run_stt())
+                    send_task = tg.create_task(send_audio())
+
+                    try:
+                        # Receive loop
+                        async for response in session.receive():
+                            # Handle Text Response (for Memory) - IF enabled in future
+                            if response.server_content and response.server_content.model_turn:
+                                for part in response.server_content.model_turn.parts:
+                                    if part.text:
+                                        # Accumulate only; flushed to short-term
+                                        # memory once on turn_complete
+                                        model_response_parts.append(part.text)
+
+                            # Handle Audio Response
+                            if response.data:
+                                # Fires per audio frame (~50Hz); guard so even the
+                                # no-op logging call is skipped at INFO level
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("VoiceService: Received audio chunk")
+                                # Yield the bytes object itself -- no wrapper
+                                # dict, no copy on the way to the websocket
+                                yield response.data
                         
-                        # Detect Turn End (simplistic: if we have both transcript and response)
-                        # In a real system, we might wait for a specific "turn_complete" signal or silence
-                        if response.server_content and response.server_content.turn_complete:
-                             logger.info("VoiceService: Turn complete, storing interaction")
-                             if self.current_user_transcript and self.current_model_response:
-                                 await self._store_interaction(
-                                     user_id, 
-                                     self.current_user_transcript, 
-                                     self.current_model_response
-                                 )
-                                 # Reset for next turn
-                                 self.current_user_transcript = ""
-                                 self.current_model_response = ""
+                            # Detect Turn End (simplistic: if we have both transcript and response)
+                            # In a real system, we might wait for a specific "turn_complete" signal or silence
+                            if response.server_content and response.server_content.turn_complete:
+                                 logger.info("VoiceService: Turn complete, storing interaction")
+                                 user_transcript = current_user_transcript
+                                 model_response = "".join(model_response_parts)
+                                 # Reset for next turn unconditionally: a side
+                                 # left hanging (late STT final, audio-only
+                                 # reply) must not be re-written wholesale on
+                                 # every later turn_complete
+                                 current_user_transcript = ""
+                                 model_response_parts.clear()
+                                 # Batched short-term writes: one per side per turn
+                                 if self.memory_service:
+                                     if user_transcript:
+                                         self.memory_service.add_to_short_term(user_id, "user", user_transcript)
+                                     if model_response:
+                                         self.memory_service.add_to_short_term(user_id, "model", model_response)
+                                 if user_transcript and model_response:
+                                     await self._store_interaction(
+                                         user_id,
+                                         user_transcript,
+                                         model_response
+                                     )
                         
-                        # Handle Tool Calls
-                        if response.tool_call:
-                            for fc in response.tool_call.function_calls:
-                                logger.info(f"VoiceService: Executing tool: {fc.name}")
-                                tool_result = None
-                                for tool in self.tools:
-                                    if tool.__name__ == fc.name:
-                                        try:
-                                            tool_result = await tool(**fc.args)
-                                            logger.info("VoiceService: Tool executed successfully")
-                                        except Exception as e:
-                                            logger.error(f"VoiceService: Tool execution failed: {e}")
-                                            tool_result = f"Error executing tool {fc.name}: {str(e)}"
-                                        break
-                                
-                                if tool_result:
-                                    tool_response = types.LiveClientToolResponse(
-                                        function_responses=[
-                                            types.FunctionResponse(
-                                                name=fc.name,
-                                                id=fc.id,
-                                                response={"result": tool_result}
-                                            )
-                                        ]
-                                    )
-                                    logger.info("VoiceService: Sending tool response to model")
-                                    await session.send(input=tool_response)
+                            # Handle Tool Calls. Tools are independent network-bound
+                            # coroutines, so run them concurrently and answer the
+                            # model with a single batched tool response.
+                            if response.tool_call:
+                                function_calls = response.tool_call.function_calls
+                                results = await asyncio.gather(
+                                    *(self._execute_tool(fc) for fc in function_calls)
+                                )
+
+                                # Answer every function call -- leaving one
+                                # unanswered stalls the model's turn -- and do
+                                # it in one send so results arrive atomically
+                                tool_response = types.LiveClientToolResponse(
+                                    function_responses=[
+                                        types.FunctionResponse(
+                                            name=fc.name,
+                                            id=fc.id,
+                                            response={"result": result}
+                                        )
+                                        for fc, result in zip(function_calls, results)
+                                    ]
+                                )
+                                logger.debug("VoiceService: Sending %d tool response(s) to model", len(function_calls))
+                                await session.send(input=tool_response)
                 
-                except Exception as e:
-                    logger.error(f"Error in receive loop: {e}")
-                    raise
-                finally:
-                    # Cleanup
-                    logger.info("Cancelling tasks")
-                    send_task.cancel()
-                    stt_task.cancel()
-                    try:
-                        await send_task
-                        await stt_task
-                    except asyncio.CancelledError:
-                        pass
+                    except Exception as e:
+                        logger.error(f"Error in receive loop: {e}")
+                        raise
+                    finally:
+                        # A send_task that finished cleanly may still be
+                        # flushing its last chunk; only cancel what's running
+                        # and let the TaskGroup exit await both.
+                        logger.info("Cleaning up audio tasks")
+                        if not send_task.done():
+                            send_task.cancel()
+                        if not stt_task.done():
+                            stt_task.cancel()
 
         except Exception as e:
             logger.error(f"Error in native audio stream: {e}")
             raise
 
+    async def _execute_tool(self, fc):
+        """Execute a single tool call, returning its result or an error string"""
+        logger.debug("VoiceService: Executing tool: %s", fc.name)
+        tool = self._tools_by_name.get(fc.name)
+        if tool is None:
+            logger.error("VoiceService: Unknown tool requested: %s", fc.name)
+            return f"Error: unknown tool {fc.name}"
+        try:
+            result = await tool(**fc.args)
+            logger.debug("VoiceService: Tool executed successfully")
+            return result
+        except Exception as e:
+            logger.error(f"VoiceService: Tool execution failed: {e}")
+            return f"Error executing tool {fc.name}: {str(e)}"
+
     async def _store_interaction(
         self,
         user_id: str,
@@ -264,6 +428,15 @@ class VoiceService:
         Store interaction in memory service (Short-Term & Long-Term)
         """
         if self.memory_service:
+            # Skip summarization when the turn is a repeat of the last stored
+            # one -- storing it again costs an embedding call and two writes
+            # without adding recall value
+            digest = hashlib.sha256(
+                f"{user_message.strip().lower()}|{agent_response.strip().lower()}".encode()
+            ).hexdigest()
+            if _last_interaction_digest.get(user_id) == digest:
+                logger.info("VoiceService: Skipping duplicate interaction summary")
+                return
             try:
                 # Note: Short-term is already added incrementally in the loop
                 
@@ -274,6 +447,21 @@ class VoiceService:
                     user_message=user_message,
                     agent_response=agent_response
                 )
+                # New memories make the cached context stale
+                _invalidate_context_cache(user_id)
+                _last_interaction_digest[user_id] = digest
                 logger.info("VoiceService: Interaction stored in long-term memory")
             except Exception as e:
                 logger.error(f"Failed to store interaction in memory: {e}")
+
+
+# Global instance
+_voice_service: "VoiceService" = None
+
+
+def get_voice_service() -> "VoiceService":
+    """Get or create the global voice service instance"""
+    global _voice_service
+    if _voice_service is None:
+        _voice_service = VoiceService()
+    return _voice_service
@@ -0,0 +1,12 @@
+"""
+Shared test configuration.
+Adds the API root to sys.path once per session so `src.*` imports resolve,
+instead of each test file appending its own (duplicate) entry.
+"""
+
+import os
+import sys
+
+API_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if API_ROOT not in sys.path:
+    sys.path.insert(0, API_ROOT)
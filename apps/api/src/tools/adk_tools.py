@@ -3,7 +3,11 @@ ADK Tool Definitions
 Converts tools to ADK-compatible format using FunctionTool
 """
 
+import asyncio
 import logging
+import re
+import time
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from google.adk.tools import FunctionTool
@@ -30,20 +34,45 @@ from .memory_tools import (
 # Import mock search for now (until we have a real one)
 from .mock_tools import get_search_service
 
+from ..db.database import get_database
+
 # Import tracker
 from ..adk_utils import get_tool_tracker
 
 logger = logging.getLogger(__name__)
 
-# Initialize services
-_search_service = None
+# Frozen prototypes for the error returns shared across tool wrappers;
+# the per-failure dict is built by unpacking these plus the message
+_ERR_FAILED = MappingProxyType({"success": False})
+_ERR_UNAVAILABLE = MappingProxyType({"available": False})
+
+# Cheap argument checks run before any await so an obviously bad call
+# (empty title, malformed date — typically an LLM-hallucinated arg)
+# fails without an event-loop hop or a DB round trip
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_TIME_RE = re.compile(r"^\d{1,2}:\d{2}$")
+_PRIORITIES = frozenset({"low", "medium", "high"})
+
+# The search service is stateless and construction is trivial, so build
+# it eagerly at import instead of None-checking on every tool call
+_SEARCH = get_search_service()
+
+# The knowledge base behind the search service changes rarely, so
+# identical queries within a short window reuse the prior result set
+_SEARCH_RESULT_TTL = 300  # seconds
+_search_result_cache: Dict[tuple, tuple] = {}  # (query, max_results) -> (ts, results)
 
-def _get_search():
-    """Lazy initialization of search service"""
-    global _search_service
-    if _search_service is None:
-        _search_service = get_search_service()
-    return _search_service
+# Cached database handle; get_database() resolves a singleton but still
+# costs an awaited call per tool invocation. Stays lazy because the
+# connection must be opened on the running event loop.
+_db = None
+
+async def _get_db():
+    """Lazy initialization of the shared database handle"""
+    global _db
+    if _db is None:
+        _db = await get_database()
+    return _db
 
 
 # ============================================================================
@@ -61,6 +90,12 @@ async def schedule_appointment(
     """
     Schedule a new appointment in the calendar.
     """
+    if not title:
+        return {**_ERR_FAILED, "error": "title is required"}
+    if not isinstance(date, str) or not _DATE_RE.match(date):
+        return {**_ERR_FAILED, "error": "date must be YYYY-MM-DD"}
+    if not isinstance(time, str) or not _TIME_RE.match(time):
+        return {**_ERR_FAILED, "error": "time must be HH:MM"}
     try:
         # Combine date and time for book_calendar_event
         start_time = f"{date}T{time}:00"
@@ -71,10 +106,10 @@ async def schedule_appointment(
             description=description,
             duration_minutes=duration_minutes
         )
-        logger.info(f"Scheduled appointment: {title} on {date} at {time}")
+        logger.info("Scheduled appointment: %s on %s at %s", title, date, time)
         
         # Track execution
-        get_tool_tracker().add_tool_execution(
+        get_tool_tracker().add_tool_execution_nowait(
             "schedule_appointment",
             {"title": title, "date": date, "time": time},
             result
@@ -82,8 +117,8 @@ async def schedule_appointment(
         
         return result
     except Exception as e:
-        logger.error(f"Failed to schedule appointment: {e}")
-        return {"error": str(e), "success": False}
+        logger.error("Failed to schedule appointment: %s", e)
+        return {**_ERR_FAILED, "error": str(e)}
 
 
 
@@ -93,20 +128,20 @@ async def get_upcoming_appointments(days_ahead: int = 7) -> List[Dict]:
     """
     try:
         result = await get_events_impl(days_ahead=days_ahead)
-        events = []
-        if result.get("status") == "success":
-            events = result.get("events", [])
+        # Only the success shape carries "events", so one lookup replaces
+        # the status compare plus keyed fetch
+        events = result.get("events") or []
         
         # Track execution
-        get_tool_tracker().add_tool_execution(
+        get_tool_tracker().add_tool_execution_nowait(
             "get_upcoming_appointments",
             {"days_ahead": days_ahead},
-            {"count": len(events), "events_summary": [e.get("title") for e in events]}
+            lambda: {"count": len(events), "events_summary": [e.get("title") for e in events]}
         )
             
         return events
     except Exception as e:
-        logger.error(f"Failed to get appointments: {e}")
+        logger.error("Failed to get appointments: %s", e)
         return []
 
 
@@ -115,11 +150,16 @@ async def check_availability(date: str, start_time: str, end_time: str) -> Dict:
     """
     Check if a time slot is available in the calendar.
     """
+    if not isinstance(date, str) or not _DATE_RE.match(date):
+        return {**_ERR_UNAVAILABLE, "error": "date must be YYYY-MM-DD"}
+    if not isinstance(start_time, str) or not isinstance(end_time, str) \
+            or not _TIME_RE.match(start_time) or not _TIME_RE.match(end_time):
+        return {**_ERR_UNAVAILABLE, "error": "times must be HH:MM"}
     try:
         result = await check_avail_impl(date, start_time, end_time)
         
         # Track execution
-        get_tool_tracker().add_tool_execution(
+        get_tool_tracker().add_tool_execution_nowait(
             "check_availability",
             {"date": date, "start": start_time, "end": end_time},
             result
@@ -127,8 +167,8 @@ async def check_availability(date: str, start_time: str, end_time: str) -> Dict:
         
         return result
     except Exception as e:
-        logger.error(f"Failed to check availability: {e}")
-        return {"available": False, "error": str(e)}
+        logger.error("Failed to check availability: %s", e)
+        return {**_ERR_UNAVAILABLE, "error": str(e)}
 
 
 # ============================================================================
@@ -140,16 +180,22 @@ async def create_task(title: str, priority: str = "medium", due_date: Optional[s
     """
     Create a new task in the todo list.
     """
+    if not title:
+        return {**_ERR_FAILED, "error": "title is required"}
+    if priority not in _PRIORITIES:
+        return {**_ERR_FAILED, "error": "priority must be one of: low, medium, high"}
+    if due_date and (not isinstance(due_date, str) or not _DATE_RE.match(due_date)):
+        return {**_ERR_FAILED, "error": "due_date must be YYYY-MM-DD"}
     try:
         result = await collect_todo_item(
             title=title,
             priority=priority,
             due_date=due_date
         )
-        logger.info(f"Created task: {title} (priority: {priority})")
+        logger.info("Created task: %s (priority: %s)", title, priority)
         
         # Track execution
-        get_tool_tracker().add_tool_execution(
+        get_tool_tracker().add_tool_execution_nowait(
             "create_task",
             {"title": title, "priority": priority},
             result
@@ -157,8 +203,8 @@ async def create_task(title: str, priority: str = "medium", due_date: Optional[s
         
         return result
     except Exception as e:
-        logger.error(f"Failed to create task: {e}")
-        return {"error": str(e), "success": False}
+        logger.error("Failed to create task: %s", e)
+        return {**_ERR_FAILED, "error": str(e)}
 
 
 
@@ -168,20 +214,18 @@ async def get_pending_tasks(priority: Optional[str] = None) -> List[Dict]:
     """
     try:
         result = await get_tasks_impl(priority=priority)
-        tasks = []
-        if result.get("status") == "success":
-            tasks = result.get("tasks", [])
+        tasks = result.get("tasks") or []
             
         # Track execution
-        get_tool_tracker().add_tool_execution(
+        get_tool_tracker().add_tool_execution_nowait(
             "get_pending_tasks",
             {"priority": priority},
-            {"count": len(tasks), "tasks_summary": [t.get("title") for t in tasks]}
+            lambda: {"count": len(tasks), "tasks_summary": [t.get("title") for t in tasks]}
         )
             
         return tasks
     except Exception as e:
-        logger.error(f"Failed to get tasks: {e}")
+        logger.error("Failed to get tasks: %s", e)
         return []
 
 
@@ -190,12 +234,14 @@ async def complete_task(task_id: str) -> Dict:
     """
     Mark a task as completed.
     """
+    if not task_id:
+        return {**_ERR_FAILED, "error": "task_id is required"}
     try:
         result = await complete_task_impl(task_id)
-        logger.info(f"Completed task: {task_id}")
+        logger.info("Completed task: %s", task_id)
         
         # Track execution
-        get_tool_tracker().add_tool_execution(
+        get_tool_tracker().add_tool_execution_nowait(
             "complete_task",
             {"task_id": task_id},
             result
@@ -203,8 +249,8 @@ async def complete_task(task_id: str) -> Dict:
         
         return result
     except Exception as e:
-        logger.error(f"Failed to complete task: {e}")
-        return {"error": str(e), "success": False}
+        logger.error("Failed to complete task: %s", e)
+        return {**_ERR_FAILED, "error": str(e)}
 
 
 # ============================================================================
@@ -216,21 +262,37 @@ def search_learning_content(query: str, max_results: int = 5) -> List[Dict]:
     """
     Search for learning content and articles on a topic.
     """
+    if not query or not query.strip():
+        return []
     try:
-        search = _get_search()
-        results = search.search(query=query, max_results=max_results)
-        logger.info(f"Found {len(results)} learning resources for: {query}")
+        cache_key = (query.strip().lower(), max_results)
+        cached = _search_result_cache.get(cache_key)
+        if cached and (time.monotonic() - cached[0]) < _SEARCH_RESULT_TTL:
+            return cached[1]
+
+        # Keep only the fields the model uses, truncated; every byte in
+        # a result is re-serialized into the downstream LLM call
+        results = [
+            {
+                "title": r.get("title", "")[:120],
+                "url": r.get("url"),
+                "snippet": r.get("snippet", "")[:300]
+            }
+            for r in _SEARCH.search_sync(query.lower(), max_results)
+        ]
+        _search_result_cache[cache_key] = (time.monotonic(), results)
+        logger.info("Found %d learning resources for: %s", len(results), query)
         
         # Track execution
-        get_tool_tracker().add_tool_execution(
+        get_tool_tracker().add_tool_execution_nowait(
             "search_learning_content",
             {"query": query},
-            {"count": len(results), "titles": [r.get("title") for r in results]}
+            lambda: {"count": len(results), "titles": [r.get("title") for r in results]}
         )
         
         return results
     except Exception as e:
-        logger.error(f"Failed to search content: {e}")
+        logger.error("Failed to search content: %s", e)
         return []
 
 
@@ -244,67 +306,139 @@ async def get_health_data(user_id: str, days: int = 7) -> List[Dict]:
     Retrieve user's health and wellness data from the database.
     """
     try:
-        # Import here to avoid circular dependencies
-        from ..db.database import get_database
-        
-        db = await get_database()
+        db = await _get_db()
         health_logs = await db.get_user_health_logs(user_id, limit=days)
-        logger.info(f"Retrieved {len(health_logs)} health logs for user {user_id}")
+        logger.info("Retrieved %d health logs for user %s", len(health_logs), user_id)
         
         # Track execution
-        get_tool_tracker().add_tool_execution(
+        get_tool_tracker().add_tool_execution_nowait(
             "get_health_data",
             {"days": days},
-            {"count": len(health_logs), "latest_imbalance": health_logs[0].get("imbalance_score") if health_logs else None}
+            lambda: {"count": len(health_logs), "latest_imbalance": health_logs[0].get("imbalance_score") if health_logs else None}
         )
         
         return health_logs
     except Exception as e:
-        logger.error(f"Failed to get health data: {e}")
+        logger.error("Failed to get health data: %s", e)
         return []
 
 
+async def get_planner_snapshot(days_ahead: int = 7) -> Dict:
+    """
+    Retrieve upcoming appointments and pending tasks in one call.
+    Use this instead of the two individual reads when planning a day or week.
+    """
+    try:
+        # One timestamp shared by both reads, fanned out concurrently
+        as_of = datetime.now().isoformat()
+        async with asyncio.TaskGroup() as tg:
+            events_task = tg.create_task(get_upcoming_appointments(days_ahead=days_ahead))
+            tasks_task = tg.create_task(get_pending_tasks())
+
+        return {
+            "as_of": as_of,
+            "appointments": events_task.result(),
+            "pending_tasks": tasks_task.result()
+        }
+    except Exception as e:
+        logger.error("Failed to get planner snapshot: %s", e)
+        return {**_ERR_FAILED, "error": str(e)}
+
+
+async def get_vibe_snapshot(user_id: str, days: int = 7) -> Dict:
+    """
+    Retrieve the user's health data, profile and medical profile in one call.
+    Use this instead of the three individual reads when a full picture is needed.
+    """
+    try:
+        # The three reads are independent; fan out under a TaskGroup so
+        # the turn pays max() of the round-trips instead of their sum
+        async with asyncio.TaskGroup() as tg:
+            health_task = tg.create_task(get_health_data(user_id, days=days))
+            profile_task = tg.create_task(get_user_profile())
+            medical_task = tg.create_task(get_medical_profile())
+
+        return {
+            "health_data": health_task.result(),
+            "profile": profile_task.result(),
+            "medical_profile": medical_task.result()
+        }
+    except Exception as e:
+        logger.error("Failed to get vibe snapshot: %s", e)
+        return {**_ERR_FAILED, "error": str(e)}
+
+
 # ============================================================================
 # Tool Collections
 # ============================================================================
 
+# Collections are tuples: immutable (callers can't accidentally append),
+# cheaper to iterate, and built exactly once at import.
+
+# Pre-wrap each tool as a FunctionTool at import so the schema
+# introspection (inspect.signature -> function declaration) runs once
+# instead of on every agent construction. The raw coroutine stays
+# reachable via .func; the declared name via .name.
+schedule_appointment_tool = FunctionTool(schedule_appointment)
+get_upcoming_appointments_tool = FunctionTool(get_upcoming_appointments)
+check_availability_tool = FunctionTool(check_availability)
+create_task_tool = FunctionTool(create_task)
+get_pending_tasks_tool = FunctionTool(get_pending_tasks)
+complete_task_tool = FunctionTool(complete_task)
+search_learning_content_tool = FunctionTool(search_learning_content)
+get_health_data_tool = FunctionTool(get_health_data)
+save_user_fact_tool = FunctionTool(save_user_fact)
+get_user_profile_tool = FunctionTool(get_user_profile)
+save_medical_info_tool = FunctionTool(save_medical_info)
+get_medical_profile_tool = FunctionTool(get_medical_profile)
+save_user_preference_tool = FunctionTool(save_user_preference)
+search_memory_tool = FunctionTool(search_memory)
+get_vibe_snapshot_tool = FunctionTool(get_vibe_snapshot)
+get_planner_snapshot_tool = FunctionTool(get_planner_snapshot)
+
 # Tools for Planner Agent
-PLANNER_TOOLS = [
-    schedule_appointment,
-    get_upcoming_appointments,
-    check_availability,
-    create_task,
-    get_pending_tasks,
-    complete_task
-]
+PLANNER_TOOLS = (
+    get_planner_snapshot_tool,
+    schedule_appointment_tool,
+    get_upcoming_appointments_tool,
+    check_availability_tool,
+    create_task_tool,
+    get_pending_tasks_tool,
+    complete_task_tool
+)
 
 # Tools for Knowledge Agent
-KNOWLEDGE_TOOLS = [
-    search_learning_content
-]
+KNOWLEDGE_TOOLS = (
+    search_learning_content_tool,
+)
 
-# Tools for Vibe Agent
 # Tools for Vibe Agent
 from .planner_tool import consult_planner_wrapper
 from .knowledge_tool import consult_knowledge_wrapper
 
-# ... (existing imports)
-
-# Tools for Vibe Agent
-ORCHESTRATOR_TOOLS = [
-    get_health_data,
-    save_user_fact,
-    get_user_profile,
-    save_medical_info,
-    get_medical_profile,
-    save_user_preference,
-    search_memory,
-    consult_planner_wrapper,
-    consult_knowledge_wrapper
-]
+consult_planner_wrapper_tool = FunctionTool(consult_planner_wrapper)
+consult_knowledge_wrapper_tool = FunctionTool(consult_knowledge_wrapper)
+
+ORCHESTRATOR_TOOLS = (
+    get_vibe_snapshot_tool,
+    get_health_data_tool,
+    save_user_fact_tool,
+    get_user_profile_tool,
+    save_medical_info_tool,
+    get_medical_profile_tool,
+    save_user_preference_tool,
+    search_memory_tool,
+    consult_planner_wrapper_tool,
+    consult_knowledge_wrapper_tool
+)
 
 # Backward compatibility
 VIBE_TOOLS = ORCHESTRATOR_TOOLS
 
 # All available tools
 ALL_TOOLS = PLANNER_TOOLS + KNOWLEDGE_TOOLS + VIBE_TOOLS
+
+# Name -> implementation dispatch map for callers that execute tools
+# directly (the live voice session); built once from the frozen
+# collections instead of per connection
+TOOLS_BY_NAME = MappingProxyType({t.name: t.func for t in ALL_TOOLS})
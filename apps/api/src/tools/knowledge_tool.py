@@ -3,7 +3,9 @@ Knowledge Tool (Agent-as-a-Tool)
 Delegates research and learning requests to the KnowledgeAgent.
 """
 
+import asyncio
 import logging
+import time
 from typing import Dict, Any, Optional
 
 from src.db.database import get_database
@@ -12,6 +14,16 @@ from src.context import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
+# Identical re-asks of a topic within a short window skip the whole
+# agent run (search, prompt build, LLM call); keyed per user so one
+# user's phrasing never leaks into another's answer.
+_RESPONSE_CACHE_TTL = 300  # seconds
+_response_cache: Dict[tuple, tuple] = {}  # (user_id, topic) -> (ts, text)
+
+# Cap concurrent knowledge-agent runs so a burst of consults queues
+# here instead of thundering-herding the Gemini API rate limits
+_LLM_SEM = asyncio.Semaphore(8)
+
 # Global instance
 _knowledge_agent = None
 
@@ -32,21 +44,31 @@ async def consult_knowledge_wrapper(topic: str) -> str:
     Args:
         topic: The specific topic or question to research.
     """
-    logger.info(f"Consulting Knowledge Agent with topic: {topic}")
+    logger.info("Consulting Knowledge Agent with topic: %s", topic)
     
     try:
         agent = await get_knowledge_agent()
         # Use dynamic user_id from context
         user_id = get_current_user_id()
-        
-        response = await agent.process_message(user_id, topic)
-        
+
+        cache_key = (user_id, topic.strip().lower())
+        cached = _response_cache.get(cache_key)
+        if cached and (time.monotonic() - cached[0]) < _RESPONSE_CACHE_TTL:
+            return cached[1]
+
+        async with _LLM_SEM:
+            response = await agent.process_message(user_id, topic)
+
         # Extract the text response from the agent's result
-        response_text = response.get("response", "I couldn't find information on that topic.")
-        
+        response_text = response.get("response")
+        if response_text:
+            _response_cache[cache_key] = (time.monotonic(), response_text)
+        else:
+            response_text = "I couldn't find information on that topic."
+
         logger.info("Knowledge Agent consulted successfully")
         return response_text
         
     except Exception as e:
-        logger.error(f"Error consulting Knowledge Agent: {e}", exc_info=True)
+        logger.error("Error consulting Knowledge Agent: %s", e, exc_info=True)
         return "I encountered an error while trying to consult the knowledge base."
@@ -3,7 +3,10 @@ Memory Tools
 Tools for the Vibe Agent to interact with persistent user memory (facts, medical, preferences).
 """
 
+import asyncio
+import functools
 import logging
+import time
 import uuid
 from typing import Dict, List, Optional
 
@@ -13,6 +16,148 @@ from src.context import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
+# Module-level database handle: get_database() returns a singleton, but
+# awaiting it still allocates a coroutine and costs a scheduler hop per
+# tool call. After the first resolution, reads grab _db synchronously.
+_db = None
+
+async def _get_db():
+    """Resolve and cache the shared database handle"""
+    global _db
+    if _db is None:
+        _db = await get_database()
+    return _db
+
+# Profile/medical/search results change rarely within a conversation but
+# are re-read on most agent turns; short TTL caches turn the repeat reads
+# into dict lookups. Writes invalidate the user's entries immediately.
+_PROFILE_CACHE_TTL = 60  # seconds
+_SEARCH_CACHE_TTL = 30   # seconds
+_profile_cache: Dict[tuple, tuple] = {}   # (user_id, categories) -> (ts, result)
+_medical_cache: Dict[str, tuple] = {}     # user_id -> (ts, result)
+_search_cache: Dict[tuple, tuple] = {}    # (user_id, query) -> (ts, result)
+
+# IDs are deterministic name hashes, so repeated saves of the same key —
+# common while a conversation refines a fact — resolve from the memo
+# instead of re-hashing. The derivation must stay uuid5 over the
+# colon-joined parts: existing rows are keyed by these IDs and the
+# INSERT OR REPLACE write path matches on the primary key alone, so a
+# different hash would duplicate every previously saved fact.
+def _det_id(*parts: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, ":".join(parts)))
+
+@functools.lru_cache(maxsize=4096)
+def _fact_id(user_id: str, category: str, fact_key: str) -> str:
+    return _det_id(user_id, category, fact_key)
+
+@functools.lru_cache(maxsize=4096)
+def _medical_id(user_id: str, condition_name: str) -> str:
+    return _det_id(user_id, "medical", condition_name)
+
+@functools.lru_cache(maxsize=4096)
+def _pref_id(user_id: str, category: str, pref_key: str) -> str:
+    return _det_id(user_id, "pref", category, pref_key)
+
+# Write-through dedup: agents often repeat the same fact extraction
+# across turns, and each repeat used to cost a full UPSERT. Remember the
+# last written value per key and short-circuit identical saves.
+_FACT_DEDUP_MAX = 10_000
+_last_fact_value: Dict[tuple, str] = {}  # (user_id, category, fact_key) -> value
+
+def _invalidate_profile_cache(user_id: str):
+    """Drop cached profile reads for a user after a write"""
+    for key in [k for k in _profile_cache if k[0] == user_id]:
+        _profile_cache.pop(key, None)
+
+def invalidate_search_cache(user_id: str):
+    """Drop cached memory searches for a user after new memories are stored"""
+    for key in [k for k in _search_cache if k[0] == user_id]:
+        _search_cache.pop(key, None)
+
+# ============================================================================
+# Write coalescing
+# ============================================================================
+# Saves arriving within a short window (common during onboarding, when a
+# turn produces several save_user_fact calls) are grouped into one
+# executemany + commit instead of paying a transaction per call. Callers
+# still await their own result via a per-item future.
+
+_WRITE_COALESCE_WINDOW = 0.005  # seconds
+_WRITE_BATCH_MAX = 32
+_write_queue: Optional[asyncio.Queue] = None
+_write_flusher_task = None
+_write_loop = None
+
+async def _run_write_batch(db, kind: str, items: list):
+    """Execute one group of queued writes and resolve their futures"""
+    payloads = [payload for payload, _ in items]
+    futures = [future for _, future in items]
+    try:
+        if kind == "fact" and len(items) > 1:
+            results = await db.save_user_facts_batch(payloads)
+        elif kind == "pref" and len(items) > 1:
+            results = await db.save_user_preferences_batch(payloads)
+        elif kind == "fact":
+            results = [await db.save_user_fact(**payloads[0])]
+        elif kind == "pref":
+            results = [await db.save_user_preference(**payloads[0])]
+        else:
+            results = [await db.save_medical_condition(**p) for p in payloads]
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+    except Exception as e:
+        for future in futures:
+            if not future.done():
+                future.set_exception(e)
+
+async def _write_flusher():
+    """Drain the write queue, coalescing bursts into grouped writes"""
+    while True:
+        item = await _write_queue.get()
+        batch = [item]
+        try:
+            while len(batch) < _WRITE_BATCH_MAX:
+                batch.append(await asyncio.wait_for(
+                    _write_queue.get(), timeout=_WRITE_COALESCE_WINDOW
+                ))
+        except asyncio.TimeoutError:
+            pass
+
+        groups: Dict[str, list] = {}
+        for kind, payload, future in batch:
+            groups.setdefault(kind, []).append((payload, future))
+
+        try:
+            db = _db if _db is not None else await _get_db()
+        except Exception as e:
+            # A dead DB must surface as the save tools' error dicts, not
+            # leave the drained batch's callers awaiting forever
+            for items in groups.values():
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+            continue
+
+        for kind, items in groups.items():
+            await _run_write_batch(db, kind, items)
+
+async def _enqueue_write(kind: str, payload: Dict):
+    """Queue a write and wait for its result"""
+    global _write_queue, _write_flusher_task, _write_loop
+    loop = asyncio.get_running_loop()
+    if _write_loop is not loop:
+        # First use, or the loop changed (tests); rebuild queue + flusher
+        _write_loop = loop
+        _write_queue = asyncio.Queue()
+        _write_flusher_task = loop.create_task(_write_flusher())
+    elif _write_flusher_task.done():
+        _write_flusher_task = loop.create_task(_write_flusher())
+
+    future = loop.create_future()
+    _write_queue.put_nowait((kind, payload, future))
+    return await future
+
 # ============================================================================
 # Tool Functions
 # ============================================================================
@@ -31,22 +176,33 @@ async def save_user_fact(
         fact_key: Specific key for the fact (e.g., "spouse_name", "job_title").
         fact_value: The value of the fact.
     """
+    # Reject empty args before paying the queue hop and DB write
+    if not category or not fact_key or not fact_value:
+        return {"status": "error", "message": "category, fact_key and fact_value are required"}
     try:
-        db = await get_database()
         user_id = get_current_user_id()
         # Generate a deterministic ID based on user, category, key to ensure uniqueness/updates
-        fact_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{user_id}:{category}:{fact_key}"))
-        
-        result = await db.save_user_fact(
-            fact_id=fact_id,
-            user_id=user_id,
-            category=category,
-            fact_key=fact_key,
-            fact_value=fact_value
-        )
+        fact_id = _fact_id(user_id, category, fact_key)
+
+        dedup_key = (user_id, category, fact_key)
+        if _last_fact_value.get(dedup_key) == fact_value:
+            # Identical to what we last wrote; skip the no-op UPSERT
+            return {"status": "success", "fact": {"fact_id": fact_id, "cached": True}}
+
+        result = await _enqueue_write("fact", {
+            "fact_id": fact_id,
+            "user_id": user_id,
+            "category": category,
+            "fact_key": fact_key,
+            "fact_value": fact_value
+        })
+        if len(_last_fact_value) >= _FACT_DEDUP_MAX:
+            _last_fact_value.clear()
+        _last_fact_value[dedup_key] = fact_value
+        _invalidate_profile_cache(user_id)
         return {"status": "success", "fact": result}
     except Exception as e:
-        logger.error(f"Error saving user fact: {e}")
+        logger.error("Error saving user fact: %s", e)
         return {"status": "error", "message": str(e)}
 
 async def get_user_profile(categories: Optional[List[str]] = None) -> Dict:
@@ -57,26 +213,35 @@ async def get_user_profile(categories: Optional[List[str]] = None) -> Dict:
         categories: Optional list of categories to filter by.
     """
     try:
-        db = await get_database()
+        db = _db if _db is not None else await _get_db()
         user_id = get_current_user_id()
-        
-        facts = []
+
+        cache_key = (user_id, tuple(sorted(categories)) if categories else None)
+        cached = _profile_cache.get(cache_key)
+        if cached and (time.monotonic() - cached[0]) < _PROFILE_CACHE_TTL:
+            return cached[1]
+
+        # Facts and preferences are independent reads; overlap them.
+        # Category filters go through one IN-clause query instead of a
+        # serial fetch per category.
         if categories:
-            for cat in categories:
-                cat_facts = await db.get_user_facts(user_id, category=cat)
-                facts.extend(cat_facts)
+            facts_coro = db.get_user_facts_multi(user_id, list(categories))
         else:
-            facts = await db.get_user_facts(user_id)
-            
-        preferences = await db.get_user_preferences(user_id)
+            facts_coro = db.get_user_facts(user_id)
+        facts, preferences = await asyncio.gather(
+            facts_coro,
+            db.get_user_preferences(user_id)
+        )
         
-        return {
+        result = {
             "status": "success",
             "facts": facts,
             "preferences": preferences
         }
+        _profile_cache[cache_key] = (time.monotonic(), result)
+        return result
     except Exception as e:
-        logger.error(f"Error getting user profile: {e}")
+        logger.error("Error getting user profile: %s", e)
         return {"status": "error", "message": str(e)}
 
 async def save_medical_info(
@@ -94,23 +259,25 @@ async def save_medical_info(
         notes: Additional notes.
         medications: List of medications associated with this condition.
     """
+    if not condition_name or not status:
+        return {"status": "error", "message": "condition_name and status are required"}
     try:
-        db = await get_database()
         user_id = get_current_user_id()
         # Generate deterministic ID
-        condition_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{user_id}:medical:{condition_name}"))
-        
-        result = await db.save_medical_condition(
-            condition_id=condition_id,
-            user_id=user_id,
-            condition_name=condition_name,
-            status=status,
-            notes=notes,
-            medications=medications
-        )
+        condition_id = _medical_id(user_id, condition_name)
+
+        result = await _enqueue_write("medical", {
+            "condition_id": condition_id,
+            "user_id": user_id,
+            "condition_name": condition_name,
+            "status": status,
+            "notes": notes,
+            "medications": medications
+        })
+        _medical_cache.pop(user_id, None)
         return {"status": "success", "condition": result}
     except Exception as e:
-        logger.error(f"Error saving medical info: {e}")
+        logger.error("Error saving medical info: %s", e)
         return {"status": "error", "message": str(e)}
 
 async def get_medical_profile() -> Dict:
@@ -118,12 +285,19 @@ async def get_medical_profile() -> Dict:
     Retrieve the user's medical profile.
     """
     try:
-        db = await get_database()
+        db = _db if _db is not None else await _get_db()
         user_id = get_current_user_id()
+
+        cached = _medical_cache.get(user_id)
+        if cached and (time.monotonic() - cached[0]) < _PROFILE_CACHE_TTL:
+            return cached[1]
+
         conditions = await db.get_user_medical_profile(user_id)
-        return {"status": "success", "conditions": conditions}
+        result = {"status": "success", "conditions": conditions}
+        _medical_cache[user_id] = (time.monotonic(), result)
+        return result
     except Exception as e:
-        logger.error(f"Error getting medical profile: {e}")
+        logger.error("Error getting medical profile: %s", e)
         return {"status": "error", "message": str(e)}
 
 async def save_user_preference(
@@ -139,22 +313,29 @@ async def save_user_preference(
         pref_key: Specific preference key.
         pref_value: Preference value.
     """
+    if not category or not pref_key or not pref_value:
+        return {"status": "error", "message": "category, pref_key and pref_value are required"}
     try:
-        db = await get_database()
         user_id = get_current_user_id()
         # Generate deterministic ID
-        pref_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{user_id}:pref:{category}:{pref_key}"))
-        
-        result = await db.save_user_preference(
-            pref_id=pref_id,
-            user_id=user_id,
-            category=category,
-            pref_key=pref_key,
-            pref_value=pref_value
-        )
+        pref_id = _pref_id(user_id, category, pref_key)
+
+        result = await _enqueue_write("pref", {
+            "pref_id": pref_id,
+            "user_id": user_id,
+            "category": category,
+            "pref_key": pref_key,
+            "pref_value": pref_value
+        })
+        _invalidate_profile_cache(user_id)
+        if category == "general" and pref_key == "timezone":
+            # The calendar tools TTL-cache this preference; drop their
+            # entry so the new zone applies on the next call
+            from .productivity_tools import invalidate_timezone_cache
+            invalidate_timezone_cache(user_id)
         return {"status": "success", "preference": result}
     except Exception as e:
-        logger.error(f"Error saving user preference: {e}")
+        logger.error("Error saving user preference: %s", e)
         return {"status": "error", "message": str(e)}
 
 
@@ -166,24 +347,33 @@ async def search_memory(query: str) -> List[Dict]:
     Args:
         query: The search query (e.g., "what did we discuss about the project", "details about my trip").
     """
+    if not query or not query.strip():
+        return []
     try:
-        db = await get_database()
+        db = _db if _db is not None else await _get_db()
         memory_service = get_memory_service(db)
         user_id = get_current_user_id()
-        
+
+        cache_key = (user_id, query)
+        cached = _search_cache.get(cache_key)
+        if cached and (time.monotonic() - cached[0]) < _SEARCH_CACHE_TTL:
+            return cached[1]
+
         results = await memory_service.get_agent_memories(
             user_id=user_id,
             agent_id="vibe", # Search across vibe agent memories by default
             query=query,
             limit=5
         )
-        
-        return [
-            {"summary": r.get("summary_text"), "timestamp": r.get("created_at")} 
+
+        summaries = [
+            {"summary": r.get("summary_text"), "timestamp": r.get("created_at")}
             for r in results
         ]
+        _search_cache[cache_key] = (time.monotonic(), summaries)
+        return summaries
     except Exception as e:
-        logger.error(f"Error searching memory: {e}")
+        logger.error("Error searching memory: %s", e)
         return []
 
 
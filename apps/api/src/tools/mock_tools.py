@@ -3,14 +3,62 @@ Mock tool implementations for the Personal Vibe CEO System
 These simulate external service calls for demonstration purposes
 """
 
+import bisect
+import functools
 import logging
+import re
 import uuid
 import random
+from collections import defaultdict
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Relative-time phrases the mock calendar understands, matched in one
+# compiled pass and mapped to their offsets
+_REL_RE = re.compile(r"next week|tomorrow|next month", re.IGNORECASE)
+_REL_DELTAS = {
+    "next week": timedelta(days=7, hours=14),   # Next week at 2pm
+    "tomorrow": timedelta(days=1, hours=10),    # Tomorrow at 10am
+    "next month": timedelta(days=30, hours=14),
+}
+
+# Canned article summaries, built once; one shared RNG instance
+_SUMMARIES = (
+    "This article provides comprehensive coverage of the topic with practical examples and recent research findings.",
+    "An in-depth exploration of key concepts with actionable insights for implementation.",
+    "Expert analysis combining theoretical foundations with real-world applications.",
+)
+_RNG = random.Random()
+
+
+# Slotted records for stored events/tasks: much smaller than dicts and
+# faster to access in filters. Converted back to dicts at the service
+# boundary so callers see the same shapes as before.
+@dataclass(slots=True)
+class Event:
+    event_id: str
+    title: str
+    description: str
+    start_time: str
+    end_time: str
+    location: Optional[str]
+    status: str
+
+
+@dataclass(slots=True)
+class Task:
+    task_id: str
+    title: str
+    description: Optional[str]
+    priority: str
+    due_date: Optional[str]
+    status: str
+    created_at: str
+    completed_at: Optional[str] = None
+
 
 class MockCalendarService:
     """
@@ -19,7 +67,15 @@ class MockCalendarService:
     """
     
     def __init__(self):
-        self.events: Dict[str, Dict] = {}
+        self.events: Dict[str, Event] = {}
+        # Events sorted by parsed start time (parallel lists, maintained
+        # with bisect) so window reads are a binary search plus a slice
+        # instead of re-parsing and sorting every event per call
+        self._start_keys: List[datetime] = []
+        self._start_ids: List[str] = []
+        # Parsed start time per event, so no path ever re-parses the
+        # ISO string after scheduling
+        self._start_dts: Dict[str, datetime] = {}
         logger.info("MockCalendarService initialized")
     
     async def schedule_event(
@@ -43,69 +99,77 @@ class MockCalendarService:
         Returns:
             Created event details
         """
-        event_id = str(uuid.uuid4())
+        # .hex skips the hyphenated formatting pass and stores 32 chars
+        event_id = uuid.uuid4().hex
         
         # Parse relative time expressions
         scheduled_time = self._parse_time(start_time)
         end_time = scheduled_time + timedelta(minutes=duration_minutes)
         
-        event = {
-            "event_id": event_id,
-            "title": title,
-            "description": description,
-            "start_time": scheduled_time.isoformat(),
-            "end_time": end_time.isoformat(),
-            "location": location,
-            "status": "scheduled"
-        }
-        
+        event = Event(
+            event_id=event_id,
+            title=title,
+            description=description,
+            start_time=scheduled_time.isoformat(),
+            end_time=end_time.isoformat(),
+            location=location,
+            status="scheduled"
+        )
+
         self.events[event_id] = event
-        
-        logger.info(f"Scheduled event: {title} at {scheduled_time}")
-        
-        return event
+        self._start_dts[event_id] = scheduled_time
+        pos = bisect.bisect_right(self._start_keys, scheduled_time)
+        self._start_keys.insert(pos, scheduled_time)
+        self._start_ids.insert(pos, event_id)
+
+        logger.info("Scheduled event: %s at %s", title, scheduled_time)
+
+        return asdict(event)
     
     async def get_upcoming_events(self, days_ahead: int = 7) -> List[Dict]:
         """Get upcoming events within specified days"""
         now = datetime.now()
         cutoff = now + timedelta(days=days_ahead)
-        
-        upcoming = [
-            event for event in self.events.values()
-            if now <= datetime.fromisoformat(event["start_time"]) <= cutoff
-        ]
-        
-        # Sort by start time
-        upcoming.sort(key=lambda e: e["start_time"])
-        
-        return upcoming
-    
+
+        lo = bisect.bisect_left(self._start_keys, now)
+        hi = bisect.bisect_right(self._start_keys, cutoff)
+        return [asdict(self.events[event_id]) for event_id in self._start_ids[lo:hi]]
+
     async def cancel_event(self, event_id: str) -> bool:
         """Cancel an event"""
-        if event_id in self.events:
-            self.events[event_id]["status"] = "cancelled"
-            logger.info(f"Cancelled event: {event_id}")
+        event = self.events.get(event_id)
+        if event is None:
+            return False
+        if event.status == "cancelled":
+            # Already removed from the sorted view; stay idempotent
             return True
-        return False
+        event.status = "cancelled"
+        # Drop from the sorted view so window reads skip it; the stored
+        # parsed start time locates the entry by binary search
+        start_dt = self._start_dts.pop(event_id)
+        pos = bisect.bisect_left(self._start_keys, start_dt)
+        while self._start_ids[pos] != event_id:
+            pos += 1
+        del self._start_keys[pos]
+        del self._start_ids[pos]
+        logger.info("Cancelled event: %s", event_id)
+        return True
     
     def _parse_time(self, time_str: str) -> datetime:
         """Parse relative time expressions"""
-        now = datetime.now()
-        time_lower = time_str.lower()
-        
-        if "next week" in time_lower:
-            return now + timedelta(days=7, hours=14)  # Next week at 2pm
-        elif "tomorrow" in time_lower:
-            return now + timedelta(days=1, hours=10)  # Tomorrow at 10am
-        elif "next month" in time_lower:
-            return now + timedelta(days=30, hours=14)
-        else:
-            # Try to parse as ISO format
-            try:
-                return datetime.fromisoformat(time_str)
-            except:
-                # Default to tomorrow
-                return now + timedelta(days=1, hours=14)
+        # ISO is the common case; try it first so well-formed input
+        # skips the lowering and phrase scan entirely
+        try:
+            return datetime.fromisoformat(time_str)
+        except ValueError:
+            pass
+
+        match = _REL_RE.search(time_str)
+        if match:
+            return datetime.now() + _REL_DELTAS[match.group(0).lower()]
+
+        # Default to tomorrow
+        return datetime.now() + timedelta(days=1, hours=14)
 
 
 class MockSearchService:
@@ -133,6 +197,12 @@ class MockSearchService:
                 {"title": "Stress Reduction Through Awareness", "url": "https://example.com/stress-reduction", "snippet": "Using mindfulness to manage stress..."},
             ],
         }
+        # Inverted index: topic token -> articles. Lookup becomes a dict
+        # hit per query token instead of a substring scan over every topic.
+        self.index: Dict[str, List[Dict]] = {}
+        for topic, articles in self.knowledge_base.items():
+            for token in topic.split():
+                self.index.setdefault(token, []).extend(articles)
         logger.info("MockSearchService initialized")
     
     async def search(self, query: str, max_results: int = 5) -> List[Dict]:
@@ -146,36 +216,41 @@ class MockSearchService:
         Returns:
             List of search results with title, url, snippet
         """
-        query_lower = query.lower()
-        
-        # Find relevant results based on keywords
-        results = []
-        for topic, articles in self.knowledge_base.items():
-            if topic in query_lower:
-                results.extend(articles)
-        
-        # If no specific match, return random results
+        results = self.search_sync(query.lower(), max_results)
+
+        logger.info("Search for '%s' returned %s results", query, len(results))
+
+        # Hand out copies so callers can't mutate the cached entries
+        return [dict(result) for result in results]
+
+    @functools.lru_cache(maxsize=1024)
+    def search_sync(self, query_lower: str, max_results: int) -> tuple:
+        """Pure search logic, memoized per normalized query"""
+        # Find relevant results via the inverted index; query order keeps
+        # the result order deterministic, the seen-map de-dupes articles
+        # reachable through several tokens
+        seen = {}
+        for token in query_lower.split():
+            for article in self.index.get(token, ()):
+                seen.setdefault(id(article), article)
+        results = list(seen.values())
+
+        # If no specific match, return random results; seed from the
+        # query so repeats are deterministic and safe to cache
         if not results:
             all_results = [article for articles in self.knowledge_base.values() for article in articles]
-            results = random.sample(all_results, min(max_results, len(all_results)))
-        
-        # Add relevance scores
-        for i, result in enumerate(results[:max_results]):
-            result["relevance_score"] = round(1.0 - (i * 0.1), 2)
-        
-        logger.info(f"Search for '{query}' returned {len(results[:max_results])} results")
-        
-        return results[:max_results]
+            results = random.Random(query_lower).sample(all_results, min(max_results, len(all_results)))
+
+        # Add relevance scores on copies (the knowledge base stays pristine)
+        return tuple(
+            {**article, "relevance_score": round(1.0 - (i * 0.1), 2)}
+            for i, article in enumerate(results[:max_results])
+        )
     
     async def get_article_summary(self, url: str) -> str:
         """Get a summary of an article by URL"""
         # Simulate fetching article content
-        summaries = [
-            "This article provides comprehensive coverage of the topic with practical examples and recent research findings.",
-            "An in-depth exploration of key concepts with actionable insights for implementation.",
-            "Expert analysis combining theoretical foundations with real-world applications.",
-        ]
-        return random.choice(summaries)
+        return _RNG.choice(_SUMMARIES)
 
 
 class MockTodoService:
@@ -185,7 +260,11 @@ class MockTodoService:
     """
     
     def __init__(self):
-        self.tasks: Dict[str, Dict] = {}
+        self.tasks: Dict[str, Task] = {}
+        # Per-status id index so filtered reads (the planner polls
+        # "pending" constantly) touch only matching tasks. Dicts keyed by
+        # task_id act as ordered sets, keeping creation order in results.
+        self._by_status: Dict[str, Dict[str, None]] = defaultdict(dict)
         logger.info("MockTodoService initialized")
     
     async def create_task(
@@ -207,65 +286,61 @@ class MockTodoService:
         Returns:
             Created task details
         """
-        task_id = str(uuid.uuid4())
-        
-        task = {
-            "task_id": task_id,
-            "title": title,
-            "description": description,
-            "priority": priority,
-            "due_date": due_date,
-            "status": "pending",
-            "created_at": datetime.now().isoformat()
-        }
+        task_id = uuid.uuid4().hex
         
+        task = Task(
+            task_id=task_id,
+            title=title,
+            description=description,
+            priority=priority,
+            due_date=due_date,
+            status="pending",
+            created_at=datetime.now().isoformat()
+        )
+
         self.tasks[task_id] = task
-        
-        logger.info(f"Created task: {title} (priority: {priority})")
-        
-        return task
+        self._by_status["pending"][task_id] = None
+
+        logger.info("Created task: %s (priority: %s)", title, priority)
+
+        return asdict(task)
     
     async def get_tasks(self, status: str = None) -> List[Dict]:
         """Get tasks, optionally filtered by status"""
         if status:
-            return [task for task in self.tasks.values() if task["status"] == status]
-        return list(self.tasks.values())
-    
+            return [asdict(self.tasks[task_id]) for task_id in self._by_status[status]]
+        return [asdict(task) for task in self.tasks.values()]
+
     async def complete_task(self, task_id: str) -> bool:
         """Mark a task as complete"""
-        if task_id in self.tasks:
-            self.tasks[task_id]["status"] = "completed"
-            self.tasks[task_id]["completed_at"] = datetime.now().isoformat()
-            logger.info(f"Completed task: {task_id}")
-            return True
-        return False
+        task = self.tasks.get(task_id)
+        if task is None:
+            return False
+        self._by_status[task.status].pop(task_id, None)
+        task.status = "completed"
+        task.completed_at = datetime.now().isoformat()
+        self._by_status["completed"][task_id] = None
+        logger.info("Completed task: %s", task_id)
+        return True
 
 
-# Global tool instances
-_calendar_service = None
-_search_service = None
-_todo_service = None
+# Global tool instances: one cached factory instead of three copies of
+# the global/None-check dance
+@functools.cache
+def _service(cls):
+    return cls()
 
 
 def get_calendar_service() -> MockCalendarService:
     """Get or create the global calendar service instance"""
-    global _calendar_service
-    if _calendar_service is None:
-        _calendar_service = MockCalendarService()
-    return _calendar_service
+    return _service(MockCalendarService)
 
 
 def get_search_service() -> MockSearchService:
     """Get or create the global search service instance"""
-    global _search_service
-    if _search_service is None:
-        _search_service = MockSearchService()
-    return _search_service
+    return _service(MockSearchService)
 
 
 def get_todo_service() -> MockTodoService:
     """Get or create the global todo service instance"""
-    global _todo_service
-    if _todo_service is None:
-        _todo_service = MockTodoService()
-    return _todo_service
+    return _service(MockTodoService)
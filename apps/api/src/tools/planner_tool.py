@@ -4,20 +4,29 @@ Delegates planning and scheduling requests to the PlannerAgent.
 """
 
 import logging
+import time
 from typing import Dict, Any, Optional
 
 from src.db.database import get_database
-from src.agents.planner_agent import PlannerAgent
 from src.context import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
+# Repeated identical planning requests within a short window return the
+# prior plan without re-running the agent. The TTL is deliberately short
+# — plans depend on calendar/task state, which the cache cannot see.
+_RESPONSE_CACHE_TTL = 60  # seconds
+_response_cache: Dict[tuple, tuple] = {}  # (user_id, request) -> (ts, text)
+
 # Global instance
 _planner_agent = None
 
 async def get_planner_agent():
     global _planner_agent
     if _planner_agent is None:
+        # Import here to avoid circular dependencies
+        # (planner_agent -> adk_tools -> planner_tool)
+        from src.agents.planner_agent import PlannerAgent
         db = await get_database()
         _planner_agent = PlannerAgent(db)
     return _planner_agent
@@ -33,21 +42,30 @@ async def consult_planner_wrapper(user_request: str) -> str:
     Args:
         user_request: The full natural language request from the user.
     """
-    logger.info(f"Consulting Planner Agent with request: {user_request}")
+    logger.info("Consulting Planner Agent with request: %s", user_request)
     
     try:
         agent = await get_planner_agent()
         # Use dynamic user_id from context
         user_id = get_current_user_id()
-        
+
+        cache_key = (user_id, user_request.strip().lower())
+        cached = _response_cache.get(cache_key)
+        if cached and (time.monotonic() - cached[0]) < _RESPONSE_CACHE_TTL:
+            return cached[1]
+
         response = await agent.process_message(user_id, user_request)
-        
+
         # Extract the text response from the agent's result
-        response_text = response.get("response", "I couldn't generate a plan.")
-        
+        response_text = response.get("response")
+        if response_text:
+            _response_cache[cache_key] = (time.monotonic(), response_text)
+        else:
+            response_text = "I couldn't generate a plan."
+
         logger.info("Planner Agent consulted successfully")
         return response_text
         
     except Exception as e:
-        logger.error(f"Error consulting Planner Agent: {e}", exc_info=True)
+        logger.error("Error consulting Planner Agent: %s", e, exc_info=True)
         return "I encountered an error while trying to consult the planner."
@@ -3,7 +3,10 @@ Productivity Tools
 Tools for the Vibe Agent to manage tasks and calendar events.
 """
 
+import asyncio
 import logging
+import re
+import time
 import uuid
 from datetime import datetime, timedelta
 try:
@@ -16,16 +19,66 @@ from src.context import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
+# UTC is used on every calendar path; build it once
+# (ZoneInfo construction reads tzdata on first call)
+_UTC = ZoneInfo("UTC")
+
+# Frozen ZoneInfo instances keyed by name. The stdlib caches these too,
+# but its cache is clearable and each hit still goes through the
+# zoneinfo lookup machinery; users touch only a handful of zones.
+_ZONES = {"UTC": _UTC}
+
+def _get_zone(name: str) -> ZoneInfo:
+    """Get a cached ZoneInfo instance by name"""
+    zone = _ZONES.get(name)
+    if zone is None:
+        zone = _ZONES.setdefault(name, ZoneInfo(name))
+    return zone
+
+# Timezone preference cache: user_id -> (monotonic timestamp, tz name).
+# Users change their timezone rarely and preference writes invalidate
+# the entry, so a generous TTL saves a DB round-trip per calendar tool
+# invocation without serving stale zones.
+_TZ_CACHE_TTL = 300  # seconds
+_tz_cache: Dict[str, tuple] = {}
+
+def invalidate_timezone_cache(user_id: str) -> None:
+    """Drop the cached timezone for a user after a preference update"""
+    _tz_cache.pop(user_id, None)
+
+# One GoogleCalendarService per user for the life of the process, so
+# repeat syncs reuse the authenticated client instead of rebuilding it
+# on every call
+_gcal_services: Dict[str, object] = {}
+
+def _get_gcal_service(user_id: str):
+    """Get or create the cached Google Calendar service for a user"""
+    service = _gcal_services.get(user_id)
+    if service is None:
+        # Deferred import: googleapiclient is heavy and only needed once
+        # a calendar sync actually happens
+        from src.services.google_calendar_service import GoogleCalendarService
+        service = _gcal_services.setdefault(user_id, GoogleCalendarService(user_id))
+    return service
+
 async def _get_user_timezone(user_id: str) -> str:
-    """Get user's timezone from preferences, default to UTC"""
+    """Get user's timezone from preferences, default to UTC. Cached with a short TTL."""
+    cached = _tz_cache.get(user_id)
+    if cached and (time.monotonic() - cached[0]) < _TZ_CACHE_TTL:
+        return cached[1]
+
+    tz_name = "UTC"
     try:
         db = await get_database()
         pref = await db.get_user_preference(user_id, "general", "timezone")
         if pref:
-            return pref["pref_value"]
+            tz_name = pref["pref_value"]
     except Exception as e:
-        logger.warning(f"Failed to fetch timezone for {user_id}: {e}")
-    return "UTC"
+        logger.warning("Failed to fetch timezone for %s: %s", user_id, e)
+        return tz_name  # Don't cache failures
+
+    _tz_cache[user_id] = (time.monotonic(), tz_name)
+    return tz_name
 
 async def collect_todo_item(
     title: str,
@@ -45,7 +98,8 @@ async def collect_todo_item(
     try:
         db = await get_database()
         user_id = get_current_user_id()
-        task_id = str(uuid.uuid4())
+        # .hex skips the hyphenated formatting pass; IDs are opaque strings
+        task_id = uuid.uuid4().hex
         
         task = await db.create_task(
             task_id=task_id,
@@ -57,7 +111,7 @@ async def collect_todo_item(
         )
         return {"status": "success", "task": task}
     except Exception as e:
-        logger.error(f"Error collecting todo item: {e}")
+        logger.error("Error collecting todo item: %s", e)
         return {"status": "error", "message": str(e)}
 
 async def book_calendar_event(
@@ -80,7 +134,7 @@ async def book_calendar_event(
     try:
         db = await get_database()
         user_id = get_current_user_id()
-        event_id = str(uuid.uuid4())
+        event_id = uuid.uuid4().hex
         
         # Get user timezone
         user_tz_str = await _get_user_timezone(user_id)
@@ -90,8 +144,8 @@ async def book_calendar_event(
         end_time = parsed_start_time + timedelta(minutes=duration_minutes)
         
         # Convert to UTC for storage
-        start_utc = parsed_start_time.astimezone(ZoneInfo("UTC"))
-        end_utc = end_time.astimezone(ZoneInfo("UTC"))
+        start_utc = parsed_start_time.astimezone(_UTC)
+        end_utc = end_time.astimezone(_UTC)
         
         event = await db.create_event(
             event_id=event_id,
@@ -105,9 +159,8 @@ async def book_calendar_event(
         
         # Sync to Google Calendar (Synchronous)
         try:
-            from src.services.google_calendar_service import GoogleCalendarService
-            gcal_service = GoogleCalendarService(user_id)
-            
+            gcal_service = _get_gcal_service(user_id)
+
             # Prepare event data for Google Calendar
             gcal_event_data = {
                 "title": title,
@@ -120,20 +173,102 @@ async def book_calendar_event(
             gcal_result = await gcal_service.create_event(gcal_event_data)
             
             if gcal_result.get("status") == "success":
-                logger.info(f"Synced event to Google Calendar: {gcal_result.get('link')}")
+                logger.info("Synced event to Google Calendar: %s", gcal_result.get('link'))
                 event["google_link"] = gcal_result.get("link")
             else:
-                logger.warning(f"Failed to sync to Google Calendar: {gcal_result.get('message')}")
+                logger.warning("Failed to sync to Google Calendar: %s", gcal_result.get('message'))
                 # We don't fail the operation, just log the warning
                 
         except Exception as e:
-            logger.error(f"Error syncing to Google Calendar: {e}")
+            logger.error("Error syncing to Google Calendar: %s", e)
         
         return {"status": "success", "event": event}
     except Exception as e:
-        logger.error(f"Error booking calendar event: {e}")
+        logger.error("Error booking calendar event: %s", e)
+        return {"status": "error", "message": str(e)}
+
+async def book_calendar_events_batch(events: List[Dict]) -> Dict:
+    """
+    Book several calendar events for the current user in one pass.
+
+    Each entry takes the same fields as book_calendar_event (title,
+    start_time, and optionally description, duration_minutes, location).
+    The local rows go in as one bulk insert and the Google Calendar
+    syncs fan out concurrently, so bulk ingestion costs one DB
+    round-trip plus the slowest sync instead of the sum of every call.
+    """
+    try:
+        db = await get_database()
+        user_id = get_current_user_id()
+
+        # One timezone lookup covers the whole batch
+        user_tz_str = await _get_user_timezone(user_id)
+
+        rows = []
+        for spec in events:
+            parsed_start = _parse_time(spec["start_time"], user_tz_str)
+            end_time = parsed_start + timedelta(minutes=spec.get("duration_minutes", 60))
+            rows.append({
+                "event_id": uuid.uuid4().hex,
+                "user_id": user_id,
+                "title": spec["title"],
+                "description": spec.get("description", ""),
+                "start_time": parsed_start.astimezone(_UTC).isoformat(),
+                "end_time": end_time.astimezone(_UTC).isoformat(),
+                "location": spec.get("location"),
+            })
+
+        await db.create_events_bulk(rows)
+
+        # Fan the Google syncs out together; one service instance keeps a
+        # single authenticated client across all creates
+        try:
+            gcal_service = _get_gcal_service(user_id)
+
+            gcal_results = await asyncio.gather(
+                *(
+                    gcal_service.create_event({
+                        "title": row["title"],
+                        "description": row["description"],
+                        "location": row["location"],
+                        "start_time": row["start_time"],
+                        "end_time": row["end_time"],
+                    })
+                    for row in rows
+                ),
+                return_exceptions=True
+            )
+
+            for row, gcal_result in zip(rows, gcal_results):
+                if isinstance(gcal_result, Exception):
+                    logger.error("Error syncing to Google Calendar: %s", gcal_result)
+                elif gcal_result.get("status") == "success":
+                    row["google_link"] = gcal_result.get("link")
+                else:
+                    logger.warning("Failed to sync to Google Calendar: %s", gcal_result.get('message'))
+        except Exception as e:
+            logger.error("Error syncing batch to Google Calendar: %s", e)
+
+        return {"status": "success", "events": rows}
+    except Exception as e:
+        logger.error("Error booking calendar events batch: %s", e)
         return {"status": "error", "message": str(e)}
 
+async def _sync_gcal_update(user_id: str, google_event_id: str, gcal_updates: Dict) -> None:
+    """Push an event update to Google Calendar; failures are logged, never raised"""
+    try:
+        gcal_service = _get_gcal_service(user_id)
+
+        gcal_result = await gcal_service.update_event(google_event_id, gcal_updates)
+
+        if gcal_result.get("status") == "success":
+            logger.info("Synced update to Google Calendar: %s", gcal_result.get('link'))
+        else:
+            logger.warning("Failed to sync update to Google Calendar: %s", gcal_result.get('message'))
+
+    except Exception as e:
+        logger.error("Error syncing update to Google Calendar: %s", e)
+
 async def update_calendar_event(
     event_id: str,
     title: Optional[str] = None,
@@ -194,8 +329,8 @@ async def update_calendar_event(
                 duration = old_end - old_start
                 end_time = parsed_start_time + duration
             
-            start_utc = parsed_start_time.astimezone(ZoneInfo("UTC"))
-            end_utc = end_time.astimezone(ZoneInfo("UTC"))
+            start_utc = parsed_start_time.astimezone(_UTC)
+            end_utc = end_time.astimezone(_UTC)
             
             updates["start_time"] = start_utc.isoformat()
             updates["end_time"] = end_utc.isoformat()
@@ -204,37 +339,26 @@ async def update_calendar_event(
              # Update end time only based on existing start
              old_start = datetime.fromisoformat(existing_event["start_time"])
              if old_start.tzinfo is None:
-                 old_start = old_start.replace(tzinfo=ZoneInfo("UTC"))
+                 old_start = old_start.replace(tzinfo=_UTC)
                  
              end_time = old_start + timedelta(minutes=duration_minutes)
-             end_utc = end_time.astimezone(ZoneInfo("UTC"))
+             end_utc = end_time.astimezone(_UTC)
              updates["end_time"] = end_utc.isoformat()
 
-        # Update local DB
-        updated_event = await db.update_event(event_id, **updates)
-        
-        # Sync to Google Calendar
+        # Local write and Google sync are independent once the updates
+        # dict is built; run them concurrently instead of paying both
+        # latencies back to back
         if existing_event.get("google_event_id"):
-            try:
-                from src.services.google_calendar_service import GoogleCalendarService
-                gcal_service = GoogleCalendarService(user_id)
-                
-                gcal_updates = updates.copy()
-                # Ensure we send what Google expects if we updated times
-                
-                gcal_result = await gcal_service.update_event(existing_event["google_event_id"], gcal_updates)
-                
-                if gcal_result.get("status") == "success":
-                    logger.info(f"Synced update to Google Calendar: {gcal_result.get('link')}")
-                else:
-                    logger.warning(f"Failed to sync update to Google Calendar: {gcal_result.get('message')}")
-                    
-            except Exception as e:
-                logger.error(f"Error syncing update to Google Calendar: {e}")
-        
+            updated_event, _ = await asyncio.gather(
+                db.update_event(event_id, **updates),
+                _sync_gcal_update(user_id, existing_event["google_event_id"], updates.copy())
+            )
+        else:
+            updated_event = await db.update_event(event_id, **updates)
+
         return {"status": "success", "event": updated_event}
     except Exception as e:
-        logger.error(f"Error updating calendar event: {e}")
+        logger.error("Error updating calendar event: %s", e)
         return {"status": "error", "message": str(e)}
 
 async def get_upcoming_events(days_ahead: int = 7) -> Dict:
@@ -250,38 +374,39 @@ async def get_upcoming_events(days_ahead: int = 7) -> Dict:
         
         # Get user timezone
         user_tz_str = await _get_user_timezone(user_id)
-        user_tz = ZoneInfo(user_tz_str)
-        
-        # Calculate start_after (now in UTC)
-        start_after = datetime.now(ZoneInfo("UTC")).isoformat()
-        
-        events = await db.get_user_events(user_id, start_after=start_after)
+        user_tz = _get_zone(user_tz_str)
         
-        # Filter by days_ahead and convert to user timezone for display
-        cutoff = datetime.now(ZoneInfo("UTC")) + timedelta(days=days_ahead)
-        
-        filtered_events = []
+        # Both window bounds go into the WHERE clause; the
+        # (user_id, start_time) index returns exactly the requested days
+        # instead of every future event filtered in Python
+        now = datetime.now(_UTC)
+        cutoff = now + timedelta(days=days_ahead)
+
+        events = await db.get_user_events_between(
+            user_id, now.isoformat(), cutoff.isoformat()
+        )
+
+        # Convert to user timezone for display: one bound parser and a
+        # single dict build per event instead of copy-then-assign
+        fromisoformat = datetime.fromisoformat
+        local_events = []
         for e in events:
-            # Parse stored UTC time
-            start_utc = datetime.fromisoformat(e["start_time"])
-            # Ensure it has timezone info (if stored without 'Z')
+            start_utc = fromisoformat(e["start_time"])
+            end_utc = fromisoformat(e["end_time"])
+            # Ensure timezone info (if stored without 'Z')
             if start_utc.tzinfo is None:
-                start_utc = start_utc.replace(tzinfo=ZoneInfo("UTC"))
-                
-            if start_utc <= cutoff:
-                # Convert to user timezone
-                start_local = start_utc.astimezone(user_tz)
-                end_local = datetime.fromisoformat(e["end_time"]).replace(tzinfo=ZoneInfo("UTC")).astimezone(user_tz)
-                
-                # Update event with local times for the user
-                e_local = e.copy()
-                e_local["start_time"] = start_local.isoformat()
-                e_local["end_time"] = end_local.isoformat()
-                filtered_events.append(e_local)
-        
-        return {"status": "success", "events": filtered_events}
+                start_utc = start_utc.replace(tzinfo=_UTC)
+            if end_utc.tzinfo is None:
+                end_utc = end_utc.replace(tzinfo=_UTC)
+            local_events.append({
+                **e,
+                "start_time": start_utc.astimezone(user_tz).isoformat(),
+                "end_time": end_utc.astimezone(user_tz).isoformat(),
+            })
+
+        return {"status": "success", "events": local_events}
     except Exception as e:
-        logger.error(f"Error getting upcoming events: {e}")
+        logger.error("Error getting upcoming events: %s", e)
         return {"status": "error", "message": str(e)}
 
 async def check_availability(date: str, start_time: str, end_time: str) -> Dict:
@@ -299,7 +424,7 @@ async def check_availability(date: str, start_time: str, end_time: str) -> Dict:
         
         # Get user timezone
         user_tz_str = await _get_user_timezone(user_id)
-        user_tz = ZoneInfo(user_tz_str)
+        user_tz = _get_zone(user_tz_str)
 
         # Construct ISO timestamps in user timezone
         try:
@@ -308,44 +433,47 @@ async def check_availability(date: str, start_time: str, end_time: str) -> Dict:
             end_dt = datetime.strptime(f"{date} {end_time}", "%Y-%m-%d %H:%M").replace(tzinfo=user_tz)
             
             # Convert to UTC for comparison
-            requested_start = start_dt.astimezone(ZoneInfo("UTC"))
-            requested_end = end_dt.astimezone(ZoneInfo("UTC"))
+            requested_start = start_dt.astimezone(_UTC)
+            requested_end = end_dt.astimezone(_UTC)
             
         except ValueError:
              return {"status": "error", "message": "Invalid date/time format. Use YYYY-MM-DD and HH:MM"}
 
-        # Get events overlapping with this day
-        # For simplicity, get all future events and filter
-        # In production, DB query should be more specific
-        events = await db.get_user_events(user_id)
-        
+        # Overlap test pushed into SQL: the (user_id, start_time) index
+        # prunes to the requested window instead of fetching every stored
+        # event and re-parsing each one in Python
+        events = await db.get_events_overlapping(
+            user_id,
+            requested_start.isoformat(),
+            requested_end.isoformat()
+        )
+
         conflicts = []
-        
+
         for event in events:
-            # Parse stored UTC time
+            # Parse stored UTC time for display conversion
             event_start = datetime.fromisoformat(event["start_time"])
             if event_start.tzinfo is None:
-                event_start = event_start.replace(tzinfo=ZoneInfo("UTC"))
-                
+                event_start = event_start.replace(tzinfo=_UTC)
+
             event_end = datetime.fromisoformat(event["end_time"])
             if event_end.tzinfo is None:
-                event_end = event_end.replace(tzinfo=ZoneInfo("UTC"))
-            
-            # Check overlap
-            if (requested_start < event_end) and (requested_end > event_start):
-                # Convert conflict to user time for display
-                event_local = event.copy()
-                event_local["start_time"] = event_start.astimezone(user_tz).isoformat()
-                event_local["end_time"] = event_end.astimezone(user_tz).isoformat()
-                conflicts.append(event_local)
-                
+                event_end = event_end.replace(tzinfo=_UTC)
+
+            # Convert conflict to user time for display
+            event_local = event.copy()
+            event_local["start_time"] = event_start.astimezone(user_tz).isoformat()
+            event_local["end_time"] = event_end.astimezone(user_tz).isoformat()
+            conflicts.append(event_local)
+
+
         if conflicts:
             return {"status": "conflict", "available": False, "conflicts": conflicts}
         
         return {"status": "success", "available": True}
         
     except Exception as e:
-        logger.error(f"Error checking availability: {e}")
+        logger.error("Error checking availability: %s", e)
         return {"status": "error", "message": str(e)}
 
 async def get_pending_tasks(priority: Optional[str] = None) -> Dict:
@@ -366,7 +494,7 @@ async def get_pending_tasks(priority: Optional[str] = None) -> Dict:
             
         return {"status": "success", "tasks": tasks}
     except Exception as e:
-        logger.error(f"Error getting pending tasks: {e}")
+        logger.error("Error getting pending tasks: %s", e)
         return {"status": "error", "message": str(e)}
 
 async def complete_task(task_id: str) -> Dict:
@@ -387,33 +515,71 @@ async def complete_task(task_id: str) -> Dict:
             return {"status": "error", "message": "Task not found"}
             
     except Exception as e:
-        logger.error(f"Error completing task: {e}")
+        logger.error("Error completing task: %s", e)
         return {"status": "error", "message": str(e)}
 
+# Fast path for the most common phrasings ("today at 10am",
+# "tomorrow at 2:30pm"), compiled once instead of cascading
+# substring checks per call
+_TIME_PHRASE_RE = re.compile(
+    r"^(today|tomorrow)\s+at\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)?$",
+    re.IGNORECASE
+)
+
+# The remaining relative phrases matched in one compiled pass and mapped
+# to (days ahead, hour of day) instead of three substring scans per call
+_REL_PHRASE_RE = re.compile(r"next week|tomorrow|next month")
+_REL_PHRASE_TIME = {
+    "next week": (7, 14),
+    "tomorrow": (1, 10),
+    "next month": (30, 14),
+}
+
 def _parse_time(time_str: str, timezone_str: str = "UTC") -> datetime:
     """Helper to parse time strings with timezone awareness"""
-    tz = ZoneInfo(timezone_str)
+    tz = _get_zone(timezone_str)
     now = datetime.now(tz)
-    time_lower = time_str.lower()
-    
-    if "next week" in time_lower:
-        dt = now + timedelta(days=7)
-        return dt.replace(hour=14, minute=0, second=0, microsecond=0)
-    elif "tomorrow" in time_lower:
-        dt = now + timedelta(days=1)
-        return dt.replace(hour=10, minute=0, second=0, microsecond=0)
-    elif "next month" in time_lower:
-        dt = now + timedelta(days=30)
-        return dt.replace(hour=14, minute=0, second=0, microsecond=0)
-    else:
+
+    # ISO inputs start with a digit; parse them without the lowering
+    # and phrase scans
+    if time_str[:1].isdigit():
         try:
-            # Try ISO format first
             dt = datetime.fromisoformat(time_str)
             # If naive, assume user timezone
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=tz)
             return dt
-        except:
-            # Fallback
-            dt = now + timedelta(days=1)
-            return dt.replace(hour=14, minute=0, second=0, microsecond=0)
+        except ValueError:
+            pass
+
+    time_lower = time_str.strip().lower()
+
+    match = _TIME_PHRASE_RE.match(time_lower)
+    if match:
+        day_word, hour_str, minute_str, meridiem = match.groups()
+        hour = int(hour_str)
+        minute = int(minute_str) if minute_str else 0
+        if meridiem == "pm" and hour < 12:
+            hour += 12
+        elif meridiem == "am" and hour == 12:
+            hour = 0
+        if hour < 24 and minute < 60:
+            dt = now + timedelta(days=1) if day_word == "tomorrow" else now
+            return dt.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+    match = _REL_PHRASE_RE.search(time_lower)
+    if match:
+        days, hour = _REL_PHRASE_TIME[match.group(0)]
+        dt = now + timedelta(days=days)
+        return dt.replace(hour=hour, minute=0, second=0, microsecond=0)
+
+    try:
+        # Last chance for ISO-ish strings that didn't lead with a digit
+        dt = datetime.fromisoformat(time_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=tz)
+        return dt
+    except ValueError:
+        # Fallback
+        dt = now + timedelta(days=1)
+        return dt.replace(hour=14, minute=0, second=0, microsecond=0)
@@ -32,7 +32,7 @@ async def verify_delegation():
     from src.tools.adk_tools import VIBE_TOOLS
     
     # Verify tools list
-    tool_names = [t.__name__ for t in VIBE_TOOLS]
+    tool_names = [t.name for t in VIBE_TOOLS]
     logger.info(f"Vibe Agent Tools: {tool_names}")
     
     if "consult_planner_wrapper" in tool_names:
@@ -23,7 +23,7 @@ export function useVoice(userId?: string): UseVoiceReturn {
     const isListeningRef = useRef(false);
 
     // Audio Queue Management
-    const audioQueueRef = useRef<string[]>([]);
+    const audioQueueRef = useRef<ArrayBuffer[]>([]);
     const isPlayingRef = useRef(false);
 
     const connectWebSocket = useCallback(() => {
@@ -31,6 +31,7 @@ export function useVoice(userId?: string): UseVoiceReturn {
 
         const wsUrl = 'ws://localhost:8000/api/live-stream';
         const ws = new WebSocket(wsUrl);
+        ws.binaryType = 'arraybuffer'; // Audio arrives as raw PCM binary frames
 
         ws.onopen = () => {
             console.log('Voice WebSocket connected');
@@ -49,6 +50,13 @@ export function useVoice(userId?: string): UseVoiceReturn {
 
         ws.onmessage = async (event) => {
             try {
+                // Binary frames are raw 16-bit PCM audio responses
+                if (event.data instanceof ArrayBuffer) {
+                    audioQueueRef.current.push(event.data);
+                    processAudioQueue();
+                    return;
+                }
+
                 const data = JSON.parse(event.data);
 
                 if (data.type === 'transcript') {
@@ -59,11 +67,6 @@ export function useVoice(userId?: string): UseVoiceReturn {
                 } else if (data.type === 'agent_response') {
                     setIsProcessing(false);
                     // Optional: Display agent text response
-                } else if (data.type === 'audio_response') {
-                    console.log('Received audio response, adding to queue');
-                    // Add to queue instead of playing immediately
-                    audioQueueRef.current.push(data.payload);
-                    processAudioQueue();
                 }
             } catch (err) {
                 console.error('Error parsing WS message:', err);
@@ -98,17 +101,9 @@ export function useVoice(userId?: string): UseVoiceReturn {
         }
     };
 
-    const playAudio = async (base64Audio: string): Promise<void> => {
+    const playAudio = async (arrayBuffer: ArrayBuffer): Promise<void> => {
         return new Promise(async (resolve) => {
             try {
-                // Decode base64 to raw binary
-                const audioData = atob(base64Audio);
-                const arrayBuffer = new ArrayBuffer(audioData.length);
-                const view = new Uint8Array(arrayBuffer);
-                for (let i = 0; i < audioData.length; i++) {
-                    view[i] = audioData.charCodeAt(i);
-                }
-
                 if (!audioContextRef.current) {
                     audioContextRef.current = new (window.AudioContext || (window as any).webkitAudioContext)({
                         sampleRate: 24000, // Gemini Native Audio standard